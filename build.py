@@ -8,6 +8,10 @@ Usage examples
   python build.py build-all                          # build every project (unchanged projects skipped)
   python build.py build-all --with-tests             # build + run tests for every project
   python build.py build-all --clean                  # force full rebuild (ignore hash cache)
+  python build.py build-all --no-incremental         # rebuild everything without 'mvn clean'
+  python build.py build-all --jobs 4                 # build up to 4 independent projects at once
+  python build.py build-all --no-mvnd                # plain mvn even if mvnd is installed
+  python build.py build-all -T 1C                    # Maven -T: one thread per core inside each build
   python build.py build-all --java-version 24.0.2-tem
   python build.py build-all --mode local             # strip GPG plugin (default on dev machines)
   python build.py build-all --mode devel             # strip GPG + append -nightly_<sha> version
@@ -28,6 +32,7 @@ Usage examples
   python build.py info                               # show resolved paths + workspace projects
   python build.py idea                               # generate IntelliJ IDEA project files
   python build.py idea --force                       # overwrite existing .iml files
+  python build.py idea --verbose                     # list every generated file
   python build.py idea --java-version 24.0.2-tem     # target a specific JDK in IDEA
   python build.py sdk list                           # list installed Java candidates
   python build.py sdk install 24.0.2-tem             # install a Java candidate
@@ -37,12 +42,14 @@ Usage examples
   python build.py git checkout main                  # switch every repo to 'main'
   python build.py git checkout feature/x --create   # create + switch branch in every repo
   python build.py git fetch                          # git fetch --all --prune on every repo
+  python build.py git fetch -j 4                     # … at most 4 repos at a time
   python build.py git pull                           # git pull on every repo
   python build.py repo manifest                      # show manifest projects + revisions
   python build.py repo status                        # repo status across all projects
   python build.py repo info                          # repo info (manifest branch, remotes…)
   python build.py repo sync                          # repo sync (fetch + update all projects)
   python build.py repo forall "git log --oneline -3" # run a command in every project
+  python build.py repo forall -j 8 "git fetch -q"    # … in 8 projects at once
   python build.py repo checkout main                 # switch all projects to 'main'
   python build.py repo checkout feature/x --create  # create + switch in all projects
   python build.py repo manifest set-revision main    # change <default revision> in manifest
@@ -61,14 +68,16 @@ Usage examples
 """
 
 import argparse
-import json
+import functools
+import heapq
 import os
+import re
 import sys
 import time
-import textwrap
 import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from xml.dom import minidom
+from typing import Optional
 
 # ── make sure local modules are importable when run as a script ──────────────
 sys.path.insert(0, os.path.dirname(__file__))
@@ -79,29 +88,130 @@ import git as gitutil
 import hasher as hashermod
 import hooks as hooksmod
 import logger as log
-import maven
-import repotool
-import runner
-import sdkman
-import watcher as watchermod
+import report as reportmod
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Sub-command implementations
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _print_table(
+    title: str,
+    columns: list[tuple[str, Optional[int], dict]],
+    rows: list[tuple[str, ...]],
+) -> None:
+    """
+    Print *rows* as a rich table, or as aligned plain text if rich is missing.
+
+    Each column is ``(header, plain_width, rich_kwargs)``.  Columns with a
+    *plain_width* of ``None`` are left out of the plain fallback, whose last
+    column is never padded.  Cells may contain rich style tags such as
+    ``[green]…[/green]`` (colours, bold, dim, …); those are stripped for
+    plain output, any other bracketed text is printed as-is.
+    """
+    try:
+        from rich.table import Table  # lazy import – only table commands pay for it
+    except ImportError:
+        keep   = [(i, w) for i, (_, w, _) in enumerate(columns) if w is not None]
+        styles = r"(?:bold|dim|italic|underline|black|red|green|yellow|blue|magenta|cyan|white)"
+        markup = re.compile(rf"\[/?{styles}(?: {styles})*\]|\[/\]")
+
+        def _line(cells) -> str:
+            out = [f"{cells[i]:<{w}}" for i, w in keep[:-1]]
+            out.append(cells[keep[-1][0]])
+            return "  ".join(out) + "\n"
+
+        buf = ["\n", _line([header for header, _, _ in columns]), "─" * 80, "\n"]
+        buf.extend(_line([markup.sub("", cell) for cell in row]) for row in rows)
+        buf.append("\n")
+        sys.stdout.write("".join(buf))
+        return
+
+    table = Table(title=title, show_lines=True)
+    for header, _, kwargs in columns:
+        table.add_column(header, **kwargs)
+    for row in rows:
+        table.add_row(*row)
+    log.render(table)
+
+
+@functools.cache
 def _universal_hooks() -> dict:
-    """Return the standard pre/post hook table (universal hook for every project)."""
+    """
+    Return the standard pre/post hook table (universal hook for every project).
+    The table is built once and shared – callers must not mutate it.
+    """
     return {"pre_build": [hooksmod.universal_prebuild], "post_build": []}
 
 
+def _build_one(
+    project: dict,
+    *,
+    skip_tests: bool,
+    force: bool,
+    verbose: bool,
+    mode: str,
+    env: Optional[dict],
+    use_mvnd: bool = True,
+    maven_threads: Optional[str] = None,
+) -> bool:
+    """Run pre-build hooks, Maven and post-build hooks for a single project."""
+    import maven  # lazy import
+    # ── pre-build hooks ──────────────────────────────────────────────────
+    ctx = hooksmod.build_hook_context(project, mode=mode, verbose=verbose,
+                                      workspace_dir=cfg.WORKSPACE)
+    hook_table = _universal_hooks()
+    ok, pom_override, extra_mvn_args = hooksmod.run_hooks("pre_build", hook_table.get("pre_build", []), ctx)
+    if not ok:
+        log.error(f"Pre-build hook failed for: {project['name']}")
+        return False
+
+    # ── maven build ──────────────────────────────────────────────────────
+    ok = maven.build_project(
+        project["name"],
+        project["dir"],
+        skip_tests=skip_tests,
+        clean=force,
+        verbose=verbose,
+        env=env,
+        pom_override=pom_override,
+        extra_maven_args=extra_mvn_args,
+        use_mvnd=use_mvnd,
+        threads=maven_threads,
+    )
+    if not ok:
+        log.error(f"Build failed at: {project['name']}")
+        return False
+
+    # ── post-build hooks ─────────────────────────────────────────────────
+    ok, _, _ = hooksmod.run_hooks("post_build", hook_table.get("post_build", []), ctx)
+    if not ok:
+        log.error(f"Post-build hook failed for: {project['name']}")
+        return False
+    return True
+
+
 def cmd_build_all(args: argparse.Namespace) -> int:
-    """Build every project in dependency order, skipping unchanged projects."""
+    """
+    Build every project in dependency order, skipping unchanged projects.
+
+    With the default ``--jobs 1`` projects are built one at a time in
+    topological order.  With more jobs they are scheduled over the workspace
+    dependency graph: each one starts as soon as its own dependencies are
+    built, and each project's output (Maven's included) is printed as one
+    block when it finishes.
+    """
+    import runner  # lazy import
     skip_tests = not args.with_tests
-    java_ver   = args.java_version or cfg.JAVA_VERSION
-    mode       = getattr(args, "mode", None) or cfg.BUILD_MODE
+    java_ver   = args.java_version
+    mode       = args.mode
     force      = getattr(args, "clean", False)   # --clean forces full rebuild
-    projects   = cfg.get_projects()
+    no_cache   = force or not getattr(args, "incremental", True)
+    jobs       = getattr(args, "jobs", 1)
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    project_set = cfg.get_project_set()
+    projects   = project_set.ordered
     cache_dir  = cfg.BUILD_DIR / ".build-cache"
 
     log.banner(
@@ -109,10 +219,10 @@ def cmd_build_all(args: argparse.Namespace) -> int:
         f"Projects: {len(projects)}  |  "
         f"Tests: {'enabled' if args.with_tests else 'skipped'}  |  "
         f"Java: {java_ver or 'ambient'}  |  Mode: {mode}  |  Verbose: {args.verbose}  |  "
-        f"Force: {force}",
+        f"Force: {force}  |  Incremental: {not no_cache}  |  Jobs: {jobs}",
     )
 
-    # --clean wipes the entire hash cache so every project rebuilds
+    # --clean drops every stored fingerprint so every project rebuilds
     if force:
         hashermod.clear_cache(cache_dir)
         log.info("--clean: build cache cleared, all projects will rebuild.")
@@ -122,88 +232,160 @@ def cmd_build_all(args: argparse.Namespace) -> int:
     if env is None and java_ver:
         return 1
 
-    # Build a full manifest map once (needed for fingerprinting dep versions)
+    # Per-project timings, written to .build-cache/reports/ when done
+    report = reportmod.BuildReport("build-all")
+
+    def _timed_build(project: dict) -> bool:
+        with report.step(project["name"]) as row:
+            ok = _build_one(
+                project,
+                skip_tests=skip_tests, force=force, verbose=args.verbose,
+                mode=mode, env=env, use_mvnd=getattr(args, "mvnd", True),
+                maven_threads=getattr(args, "maven_threads", None),
+            )
+            row["status"] = "built" if ok else "failed"
+        return ok
+
+    # Load every manifest once (also needed for fingerprinting dep versions)
     all_manifests: dict = {}
+    manifests:     list = []
     for p in projects:
         m = hooksmod.ProjectManifest.load(Path(p["dir"]))
+        manifests.append(m)
         if m is not None:
             all_manifests[m.artifact_id] = m
 
     total   = len(projects)
-    start   = time.time()
+    start   = time.perf_counter()
     skipped = 0
 
-    for i, project in enumerate(projects, 1):
-        log.step(i, total, project["name"])
-
-        manifest = hooksmod.ProjectManifest.load(Path(project["dir"]))
-        artifact  = Path(project["artifact"]) if project.get("artifact") else None
-
-        # ── hash-diff check ──────────────────────────────────────────────
-        if (
-            not force
-            and manifest is not None
-            and artifact is not None
-            and hashermod.is_up_to_date(
-                Path(project["dir"]), manifest, all_manifests, mode,
-                artifact, cache_dir,
-            )
-        ):
-            log.info(f"[{project['name']}] ✓ up-to-date — skipping")
-            skipped += 1
-            continue
-
-        # ── pre-build hooks ──────────────────────────────────────────────
-        ctx = hooksmod.build_hook_context(project, mode=mode, verbose=args.verbose,
-                                          workspace_dir=cfg.WORKSPACE)
-        hook_table = _universal_hooks()
-        ok, pom_override, extra_mvn_args = hooksmod.run_hooks("pre_build", hook_table.get("pre_build", []), ctx)
-        if not ok:
-            log.error(f"Pre-build hook failed for: {project['name']}")
-            return 1
+    def _run(i: int, n: int) -> str:
+        """
+        Check, build and record project *i* as step *n* of *total*.
+        Returns ``"built"``, ``"skipped"`` or ``"failed"``; an exception is
+        logged and counts as a failed build.
+        """
+        project, manifest = projects[i], manifests[i]
+        log.step(n, total, project["name"])
 
-        # ── maven build ──────────────────────────────────────────────────
-        ok = maven.build_project(
-            project["name"],
-            project["dir"],
-            skip_tests=skip_tests,
-            clean=force,
-            verbose=args.verbose,
-            env=env,
-            pom_override=pom_override,
-            extra_maven_args=extra_mvn_args,
-        )
-        if not ok:
-            log.error(f"Build failed at: {project['name']}")
-            return 1
-
-        # ── post-build hooks ─────────────────────────────────────────────
-        ok, _, _ = hooksmod.run_hooks("post_build", hook_table.get("post_build", []), ctx)
-        if not ok:
-            log.error(f"Post-build hook failed for: {project['name']}")
-            return 1
-
-        # ── update cache & cascade-invalidate dependents ─────────────────
-        if manifest is not None:
-            hashermod.mark_built(Path(project["dir"]), manifest, all_manifests, mode, cache_dir)
-            invalidated = hashermod.invalidate_dependents(manifest.artifact_id, all_manifests, cache_dir)
-            if invalidated:
-                log.info(f"  cache invalidated for: {', '.join(invalidated)}")
+        try:
+            # ── hash-diff check (dependencies already invalidated it if rebuilt)
+            artifact = Path(project["artifact"]) if project.get("artifact") else None
+            if (
+                not no_cache
+                and manifest is not None
+                and artifact is not None
+                and hashermod.is_up_to_date(
+                    Path(project["dir"]), manifest, all_manifests, mode,
+                    artifact, cache_dir,
+                )
+            ):
+                log.info(f"[{project['name']}] ✓ up-to-date — skipping")
+                report.skipped(project["name"])
+                return "skipped"
+
+            if not _timed_build(project):
+                return "failed"
+
+            # ── update cache & cascade-invalidate dependents ─────────────
+            if manifest is not None:
+                hashermod.mark_built(Path(project["dir"]), manifest, all_manifests, mode, cache_dir)
+                invalidated = hashermod.invalidate_dependents(
+                    manifest.artifact_id, all_manifests, cache_dir,
+                    dependents=project_set.rdeps.get(manifest.artifact_id),
+                )
+                if invalidated:
+                    log.info(f"  cache invalidated for: {', '.join(invalidated)}")
+            return "built"
+        except Exception as exc:
+            log.error(f"Build failed at: {project['name']} ({exc})")
+            return "failed"
+
+    if jobs == 1:
+        # One project at a time, in topological order, all on this thread
+        for i in range(total):
+            outcome = _run(i, i + 1)
+            if outcome == "failed":
+                report.write(cache_dir, ok=False)
+                return 1
+            skipped += outcome == "skipped"
+    else:
+        # ── dependency DAG, keyed by position in the topological order ──────
+        index_of = {m.artifact_id: i for i, m in enumerate(manifests) if m is not None}
+        succs:    list[list[int]] = [[] for _ in projects]
+        indegree: list[int]       = [0] * len(projects)
+        for i, m in enumerate(manifests):
+            if m is None:
+                continue
+            for dependent in project_set.rdeps.get(m.artifact_id, ()):
+                succs[i].append(index_of[dependent])
+                indegree[index_of[dependent]] += 1
+
+        # Ready projects are kept in a heap so they start in topological order
+        ready:     list[int] = [i for i in range(total) if indegree[i] == 0]
+        remaining: set[int]  = set(range(total))   # not started yet
+        running:   dict      = {}                  # future → project index
+        step = 0
+
+        def _release(i: int) -> None:
+            for s in succs[i]:
+                indegree[s] -= 1
+                if indegree[s] == 0:
+                    heapq.heappush(ready, s)
+
+        def _run_deferred(i: int, n: int) -> tuple:
+            # Buffer the project's log (and Maven output) so it prints as one block
+            with log.deferred() as records:
+                outcome = _run(i, n)
+            return outcome, records
+
+        # A project starts as soon as all of its workspace dependencies are
+        # done, rather than waiting for the whole previous layer to finish.
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            while True:
+                while ready:
+                    i = heapq.heappop(ready)
+                    if i not in remaining:
+                        continue
+                    remaining.discard(i)
+                    step += 1
+                    running[pool.submit(_run_deferred, i, step)] = i
+
+                if not running:
+                    if not remaining:
+                        break
+                    # Cycles never become ready – build them one by one, in order
+                    heapq.heappush(ready, min(remaining))
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    outcome, records = future.result()
+                    log.replay(records)
+                    if outcome == "failed":
+                        pool.shutdown(wait=True, cancel_futures=True)
+                        report.write(cache_dir, ok=False)
+                        return 1
+                    skipped += outcome == "skipped"
+                    _release(i)
 
     built = total - skipped
     log.success(
-        f"Done in {log.duration(time.time() - start)} — "
+        f"Done in {log.duration(time.perf_counter() - start)} — "
         f"built: {built}  skipped (up-to-date): {skipped}"
     )
+    log.info(f"Report: {report.write(cache_dir, ok=True)}")
     return 0
 
 
 def cmd_run_islands(args: argparse.Namespace) -> int:
     """Build all projects then launch Islands via CoffeeLoader."""
     cache_dir = cfg.BUILD_DIR / ".build-cache"
-    mode      = getattr(args, "mode", None) or cfg.BUILD_MODE
+    mode      = args.mode
 
     if getattr(args, "watch", False):
+        import watcher as watchermod  # lazy import
         ok = watchermod.watch_and_run(
             skip_tests=not args.with_tests,
             clean=args.clean,
@@ -215,6 +397,7 @@ def cmd_run_islands(args: argparse.Namespace) -> int:
             poll_interval=args.poll_interval,
         )
     else:
+        import runner  # lazy import
         ok = runner.build_and_run_islands(
             skip_tests=not args.with_tests,
             clean_output=args.clean,
@@ -231,6 +414,7 @@ def cmd_run_islands(args: argparse.Namespace) -> int:
 
 def cmd_assemble(args: argparse.Namespace) -> int:
     """Assemble the output directory without rebuilding (expects artifacts exist)."""
+    import runner  # lazy import
     log.banner("Assemble Output")
     ok = runner._assemble_output(clean=args.clean)
     return 0 if ok else 1
@@ -259,16 +443,17 @@ def cmd_cache(args: argparse.Namespace) -> int:
         projects   = cfg.get_projects()
         mode       = cfg.BUILD_MODE
 
-        # Build manifest map
+        # Build manifest map (each project.json is loaded once)
         all_manifests: dict = {}
+        manifests:     list = []
         for p in projects:
             m = hooksmod.ProjectManifest.load(Path(p["dir"]))
+            manifests.append(m)
             if m is not None:
                 all_manifests[m.artifact_id] = m
 
         rows = []
-        for p in projects:
-            manifest = hooksmod.ProjectManifest.load(Path(p["dir"]))
+        for p, manifest in zip(projects, manifests):
             artifact  = Path(p["artifact"]) if p.get("artifact") else None
             if manifest is None:
                 rows.append((p["name"], "—", "no project.json"))
@@ -279,39 +464,25 @@ def cmd_cache(args: argparse.Namespace) -> int:
             up_to_date = hashermod.is_up_to_date(
                 Path(p["dir"]), manifest, all_manifests, mode, artifact, cache_dir
             )
-            status = "✔ up-to-date" if up_to_date else "✖ stale / not cached"
-            rows.append((p["name"], artifact.name, status))
+            if up_to_date:
+                rows.append((p["name"], artifact.name, "[green]✔ up-to-date[/green]"))
+            else:
+                rows.append((p["name"], artifact.name, "[red]✖ stale / not cached[/red]"))
 
-        try:
-            from rich.table import Table
-            from rich.console import Console
-            table = Table(title="Hash Cache", show_lines=True)
-            table.add_column("Project",  style="bold cyan", no_wrap=True)
-            table.add_column("Artifact", style="dim")
-            table.add_column("Cache",    style="bold")
-            for name, art, status in rows:
-                colour = "green" if "up-to-date" in status else "red"
-                table.add_row(name, art, f"[{colour}]{status}[/{colour}]")
-            Console().print(table)
-        except ImportError:
-            print(f"\n{'Project':<16}  {'Artifact':<42}  Cache")
-            print("─" * 80)
-            for name, art, status in rows:
-                print(f"{name:<16}  {art:<42}  {status}")
-            print()
+        _print_table("Hash Cache", [
+            ("Project",  16,   {"style": "bold cyan", "no_wrap": True}),
+            ("Artifact", 42,   {"style": "dim"}),
+            ("Cache",    0,    {"style": "bold"}),
+        ], rows)
         return 0
 
     if sub == "invalidate":
-        target = args.project
-        projects = cfg.get_projects()
-        matched = [p for p in projects if p["name"].lower() == target.lower()]
-        if not matched:
-            names = ", ".join(p["name"] for p in projects)
-            log.error(f"Project '{target}' not found. Available: {names}")
+        project = _lookup_project(args.project)
+        if project is None:
             return 1
-        m = hooksmod.ProjectManifest.load(Path(matched[0]["dir"]))
+        m = hooksmod.ProjectManifest.load(Path(project["dir"]))
         if m is None:
-            log.error(f"No project.json in {matched[0]['dir']}")
+            log.error(f"No project.json in {project['dir']}")
             return 1
         hashermod.invalidate(m.artifact_id, cache_dir)
         log.success(f"Cache entry invalidated for '{m.name}' — will rebuild on next run.")
@@ -321,43 +492,67 @@ def cmd_cache(args: argparse.Namespace) -> int:
     return 1
 
 
+def _artifacts_exist(projects: list) -> list[bool]:
+    """
+    Return, for each project, whether its artifact exists on disk.
+    The stat() calls are issued concurrently to hide filesystem latency
+    (noticeable on network or virtualised disks).
+    """
+    arts = [p.get("artifact") for p in projects]
+    if not arts:
+        return []
+    with ThreadPoolExecutor(max_workers=min(16, len(arts))) as pool:
+        return list(pool.map(lambda a: a is not None and os.path.exists(a), arts))
+
+
+def _count_jars(root: Path) -> int:
+    """
+    Count the ``*.jar`` files below *root*.
+
+    Uses ``os.scandir`` so the directory entries' cached type information is
+    reused instead of stat()ing each entry through ``Path`` objects, and only
+    keeps a running count rather than a list of paths.
+    """
+    stack = [str(root)]
+    count = 0
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                    elif e.name.endswith(".jar"):
+                        count += 1
+        except OSError:
+            continue
+    return count
+
+
 def cmd_status(args: argparse.Namespace) -> int:
     """Show whether each project's artifact exists."""
     log.banner("Project Status")
     projects = cfg.get_projects()
 
     rows = []
-    for p in projects:
+    for p, exists in zip(projects, _artifacts_exist(projects)):
         art = p.get("artifact")
         if art:
-            exists = Path(art).exists()
+            art  = Path(art)
             mark = "[green]✔[/green]" if exists else "[red]✖[/red]"
-            rows.append((p["name"], str(Path(art).name), mark, str(Path(art).parent)))
+            rows.append((p["name"], art.name, mark, str(art.parent)))
         else:
             rows.append((p["name"], "—", "[dim]?[/dim]", "—"))
 
-    try:
-        from rich.table import Table
-        from rich.console import Console
-        table = Table(title="Maven Artifacts", show_lines=True)
-        table.add_column("Project",  style="bold cyan",  no_wrap=True)
-        table.add_column("Artifact", style="dim")
-        table.add_column("Built",    justify="center")
-        table.add_column("Location", style="dim", overflow="fold")
-        for name, artifact, mark, location in rows:
-            table.add_row(name, artifact, mark, location)
-        Console().print(table)
-    except ImportError:
-        print(f"\n{'Project':<16}  {'Artifact':<45}  Built")
-        print("─" * 80)
-        for name, artifact, mark, location in rows:
-            tick = "✔" if "green" in mark else "✖"
-            print(f"{name:<16}  {artifact:<45}  {tick}")
-        print()
+    _print_table("Maven Artifacts", [
+        ("Project",  16,   {"style": "bold cyan", "no_wrap": True}),
+        ("Artifact", 45,   {"style": "dim"}),
+        ("Built",    0,    {"justify": "center"}),
+        ("Location", None, {"style": "dim", "overflow": "fold"}),
+    ], rows)
 
     if cfg.OUTPUT_DIR.exists():
-        jars = list(cfg.OUTPUT_DIR.rglob("*.jar"))
-        log.info(f"Output dir: {cfg.OUTPUT_DIR}  ({len(jars)} jar(s))")
+        log.info(f"Output dir: {cfg.OUTPUT_DIR}  ({_count_jars(cfg.OUTPUT_DIR)} jar(s))")
     else:
         log.warn(f"Output dir does not exist yet: {cfg.OUTPUT_DIR}")
     return 0
@@ -365,42 +560,43 @@ def cmd_status(args: argparse.Namespace) -> int:
 
 def cmd_info(args: argparse.Namespace) -> int:
     """Print resolved paths and workspace project list."""
-    log.banner("Build Configuration")
-
-    # Java / sdkman info
-    java_ver = cfg.JAVA_VERSION or "ambient (not configured)"
-    log.info(f"   {'Configured Java':<22} {java_ver}")
-    log.info(f"   {'Auto-install Java':<22} {cfg.AUTO_INSTALL_JAVA}")
-    if sdkman.is_available():
-        current = sdkman.current_candidate()
-        cur_str = f"{current[0]}  ({current[1]})" if current else "none"
-        log.info(f"   {'sdkman current Java':<22} {cur_str}")
-    else:
-        log.warn("   sdkman not found on this machine.")
-    print()
-
-    # Static paths
-    static_paths = {
-        "Workspace":   cfg.WORKSPACE,
-        "Build dir":   cfg.BUILD_DIR,
-        "Output dir":  cfg.OUTPUT_DIR,
-        "Modules dir": cfg.MODULES_DIR,
-    }
-    for label, path in static_paths.items():
-        exists = "✔" if path.exists() else "✖"
-        log.info(f"{exists}  {label:<22} {path}")
-    print()
-
-    # Discovered projects
-    projects = cfg.get_projects()
-    log.info(f"Discovered projects ({len(projects)}):")
-    for p in projects:
-        d = Path(p["dir"])
-        art = Path(p["artifact"]) if p.get("artifact") else None
-        art_mark = "✔" if (art and art.exists()) else "✖"
-        log.info(f"  {art_mark}  {p['name']:<16} {d}")
-        if art:
-            log.info(f"       {'artifact':<16} {art.name}")
+    import sdkman  # lazy import
+    with log.buffered():
+        log.banner("Build Configuration")
+
+        # Java / sdkman info
+        java_ver = cfg.JAVA_VERSION or "ambient (not configured)"
+        log.info(f"   {'Configured Java':<22} {java_ver}")
+        log.info(f"   {'Auto-install Java':<22} {cfg.AUTO_INSTALL_JAVA}")
+        if sdkman.is_available():
+            current = sdkman.current_candidate()
+            cur_str = f"{current[0]}  ({current[1]})" if current else "none"
+            log.info(f"   {'sdkman current Java':<22} {cur_str}")
+        else:
+            log.warn("   sdkman not found on this machine.")
+        log.newline()
+
+        # Static paths
+        static_paths = {
+            "Workspace":   cfg.WORKSPACE,
+            "Build dir":   cfg.BUILD_DIR,
+            "Output dir":  cfg.OUTPUT_DIR,
+            "Modules dir": cfg.MODULES_DIR,
+        }
+        for label, path in static_paths.items():
+            exists = "✔" if path.exists() else "✖"
+            log.info(f"{exists}  {label:<22} {path}")
+        log.newline()
+
+        # Discovered projects
+        projects = cfg.get_projects()
+        log.info(f"Discovered projects ({len(projects)}):")
+        for p, exists in zip(projects, _artifacts_exist(projects)):
+            art = Path(p["artifact"]) if p.get("artifact") else None
+            art_mark = "✔" if exists else "✖"
+            log.info(f"  {art_mark}  {p['name']:<16} {p['dir']}")
+            if art:
+                log.info(f"       {'artifact':<16} {art.name}")
     return 0
 
 
@@ -416,14 +612,14 @@ def _repos() -> list:
 def cmd_git_status(args: argparse.Namespace) -> int:
     """Show branch + working-tree status for every repo."""
     log.banner("Git Status", "Branch and working-tree summary for all repos")
-    gitutil.print_status_table(_repos())
+    gitutil.print_status_table(_repos(), jobs=args.jobs)
     return 0
 
 
 def cmd_git_branches(args: argparse.Namespace) -> int:
     """List all local branches for every repo."""
     log.banner("Git Branches", "Local branches for all repos")
-    gitutil.print_branches_table(_repos())
+    gitutil.print_branches_table(_repos(), jobs=args.jobs)
     return 0
 
 
@@ -441,7 +637,6 @@ def cmd_git_checkout(args: argparse.Namespace) -> int:
 
     ok_count = skip_count = fail_count = 0
     for repo in repos:
-        from pathlib import Path
         path = Path(repo["dir"])
         name = repo["name"]
 
@@ -471,25 +666,52 @@ def cmd_git_checkout(args: argparse.Namespace) -> int:
     return 0 if fail_count == 0 else 1
 
 
+def _git_repo_op(op, path: Path, verbose: bool) -> Optional[bool]:
+    """Run *op* on the repo at *path*; return None if it is not a git repo."""
+    if not gitutil.is_git_repo(path):
+        return None
+    return op(path, verbose=verbose)
+
+
+def _parallel_repo_op(
+    repos: list[dict],
+    op,
+    *,
+    jobs: int,
+    verbose: bool,
+    done_msg: str,
+    verb: str,
+) -> list[str]:
+    """
+    Run *op* on up to *jobs* repos at once and log each outcome as it
+    completes.  Returns the names of the repos where *op* failed.
+    """
+    failed: list[str] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(repos)))) as pool:
+        futures = {
+            pool.submit(_git_repo_op, op, Path(repo["dir"]), verbose): repo["name"]
+            for repo in repos
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            ok = future.result()
+            if ok is None:
+                log.warn(f"{name}: not a git repo – skipping")
+            elif ok:
+                log.success(f"{name}: {done_msg}")
+            else:
+                log.error(f"{name}: {verb} failed")
+                failed.append(name)
+    return failed
+
+
 def cmd_git_fetch(args: argparse.Namespace) -> int:
-    """Run ``git fetch --all --prune`` on every repo."""
+    """Run ``git fetch --all --prune`` on every repo (repos fetched concurrently)."""
     log.banner("Git Fetch", "Fetching remotes for all repos")
     repos = _repos()
-    failed = []
-    for repo in repos:
-        from pathlib import Path
-        path = Path(repo["dir"])
-        name = repo["name"]
-        if not gitutil.is_git_repo(path):
-            log.warn(f"{name}: not a git repo – skipping")
-            continue
-        log.info(f"{name}: fetching…")
-        ok = gitutil.fetch_all(path, verbose=args.verbose)
-        if ok:
-            log.success(f"{name}: fetched")
-        else:
-            log.error(f"{name}: fetch failed")
-            failed.append(name)
+    log.info(f"Fetching {len(repos)} repo(s)…")
+    failed = _parallel_repo_op(repos, gitutil.fetch_all, jobs=args.jobs,
+                               verbose=args.verbose, done_msg="fetched", verb="fetch")
     if failed:
         log.error(f"Fetch failed for: {', '.join(failed)}")
         return 1
@@ -497,24 +719,12 @@ def cmd_git_fetch(args: argparse.Namespace) -> int:
 
 
 def cmd_git_pull(args: argparse.Namespace) -> int:
-    """Run ``git pull`` on every repo."""
+    """Run ``git pull`` on every repo (repos pulled concurrently)."""
     log.banner("Git Pull", "Pulling latest commits for all repos")
     repos = _repos()
-    failed = []
-    for repo in repos:
-        from pathlib import Path
-        path = Path(repo["dir"])
-        name = repo["name"]
-        if not gitutil.is_git_repo(path):
-            log.warn(f"{name}: not a git repo – skipping")
-            continue
-        log.info(f"{name}: pulling…")
-        ok = gitutil.pull(path, verbose=args.verbose)
-        if ok:
-            log.success(f"{name}: up to date")
-        else:
-            log.error(f"{name}: pull failed")
-            failed.append(name)
+    log.info(f"Pulling {len(repos)} repo(s)…")
+    failed = _parallel_repo_op(repos, gitutil.pull, jobs=args.jobs,
+                               verbose=args.verbose, done_msg="up to date", verb="pull")
     if failed:
         log.error(f"Pull failed for: {', '.join(failed)}")
         return 1
@@ -527,6 +737,7 @@ def cmd_git_pull(args: argparse.Namespace) -> int:
 
 def _require_repo() -> bool:
     """Log an error and return False if the repo tool is unavailable."""
+    import repotool  # lazy import
     if not repotool.is_available():
         log.error(
             "Google repo tool not found on PATH.\n"
@@ -538,6 +749,7 @@ def _require_repo() -> bool:
 
 def cmd_repo_manifest(args: argparse.Namespace) -> int:
     """Show the manifest projects table, or modify the manifest."""
+    import repotool  # lazy import
     if not _require_repo():
         return 1
 
@@ -608,6 +820,7 @@ def cmd_repo_manifest(args: argparse.Namespace) -> int:
 
 def cmd_repo_status(args: argparse.Namespace) -> int:
     """Show ``repo status`` output for all projects."""
+    import repotool  # lazy import
     if not _require_repo():
         return 1
     log.banner("Repo Status")
@@ -617,6 +830,7 @@ def cmd_repo_status(args: argparse.Namespace) -> int:
 
 def cmd_repo_info(args: argparse.Namespace) -> int:
     """Show ``repo info`` (manifest branch, remotes, current revisions)."""
+    import repotool  # lazy import
     if not _require_repo():
         return 1
     log.banner("Repo Info")
@@ -626,6 +840,7 @@ def cmd_repo_info(args: argparse.Namespace) -> int:
 
 def cmd_repo_sync(args: argparse.Namespace) -> int:
     """Run ``repo sync`` to fetch and update all projects."""
+    import repotool  # lazy import
     if not _require_repo():
         return 1
     log.banner(
@@ -647,15 +862,17 @@ def cmd_repo_sync(args: argparse.Namespace) -> int:
 
 def cmd_repo_forall(args: argparse.Namespace) -> int:
     """Run an arbitrary shell command in every project via ``repo forall``."""
+    import repotool  # lazy import
     if not _require_repo():
         return 1
-    log.banner("Repo Forall", f"$ {args.cmd}")
-    ok = repotool.forall(cfg.WORKSPACE, args.cmd, verbose=args.verbose)
+    log.banner("Repo Forall", f"$ {args.cmd}  |  jobs: {args.jobs}")
+    ok = repotool.forall(cfg.WORKSPACE, args.cmd, jobs=args.jobs, verbose=args.verbose)
     return 0 if ok else 1
 
 
 def cmd_repo_checkout(args: argparse.Namespace) -> int:
     """Switch every project to *branch* (optionally creating it)."""
+    import repotool  # lazy import
     if not _require_repo():
         return 1
     log.banner(
@@ -673,19 +890,27 @@ def cmd_repo_checkout(args: argparse.Namespace) -> int:
 
 # ── project sub-commands ─────────────────────────────────────────────────────
 
+def _lookup_project(name: str) -> Optional[dict]:
+    """
+    Return the workspace project called *name* (case-insensitive), or log
+    the available project names and return None.
+    """
+    project = cfg.find_project(name)
+    if project is None:
+        names = ", ".join(p["name"] for p in cfg.get_projects())
+        log.error(f"Project '{name}' not found. Available: {names}")
+    return project
+
+
 def _find_project_by_name(name: str):  # -> tuple[dict | None, hooksmod.ProjectManifest | None]
     """
     Look up a project by name (case-insensitive) from the scanned workspace.
     Returns ``(project_dict, manifest)`` or ``(None, None)`` on failure.
     The manifest may be None if no ``project.json`` exists.
     """
-    projects = cfg.get_projects()
-    matched = [p for p in projects if p["name"].lower() == name.lower()]
-    if not matched:
-        names = ", ".join(p["name"] for p in projects)
-        log.error(f"Project '{name}' not found. Available: {names}")
+    project = _lookup_project(name)
+    if project is None:
         return None, None
-    project = matched[0]
     manifest = hooksmod.ProjectManifest.load(Path(project["dir"]))
     if manifest is None:
         log.error(
@@ -704,47 +929,32 @@ def cmd_project_list(args: argparse.Namespace) -> int:
         log.warn("No projects found. Add a project.json + pom.xml to a sub-directory.")
         return 0
 
-    try:
-        from rich.table import Table
-        from rich.console import Console
-
-        table = Table(title=f"Projects  ({len(projects)}  in build order)", show_lines=True)
-        table.add_column("#",          justify="right", style="dim")
-        table.add_column("Name",       style="bold cyan",  no_wrap=True)
-        table.add_column("Type",       style="bold")
-        table.add_column("G:A:V",      style="dim")
-        table.add_column("Deps",       style="dim")
-        table.add_column("Built",      justify="center")
-        table.add_column("Dir",        style="dim", overflow="fold")
-
-        for i, p in enumerate(projects, 1):
-            m = hooksmod.ProjectManifest.load(Path(p["dir"]))
-            art = Path(p["artifact"]) if p.get("artifact") else None
-            built = "✔" if (art and art.exists()) else "✖"
-            if m:
-                gav  = f"{m.group_id}:{m.artifact_id}:{m.version}"
-                deps = ", ".join(d["artifactId"] for d in m.workspace_deps) or "—"
-                type_str = (
-                    f"[yellow]{m.project_type}[/yellow]"
-                    if m.project_type == "application"
-                    else f"[blue]{m.project_type}[/blue]"
-                )
-            else:
-                gav = deps = type_str = "[dim]no project.json[/dim]"
-            table.add_row(str(i), p["name"], type_str, gav, deps, built,
-                          str(Path(p["dir"]).relative_to(cfg.WORKSPACE)))
-        Console().print(table)
-
-    except ImportError:
-        print(f"\n{'#':<3}  {'Name':<16}  {'G:A:V':<40}  Built")
-        print("─" * 80)
-        for i, p in enumerate(projects, 1):
-            m = hooksmod.ProjectManifest.load(Path(p["dir"]))
-            art = Path(p["artifact"]) if p.get("artifact") else None
-            built = "✔" if (art and art.exists()) else "✖"
-            gav = f"{m.group_id}:{m.artifact_id}:{m.version}" if m else "—"
-            print(f"{i:<3}  {p['name']:<16}  {gav:<40}  {built}")
-        print()
+    ws_prefix = str(cfg.WORKSPACE).rstrip(os.sep) + os.sep
+    rows = []
+    for i, (p, exists) in enumerate(zip(projects, _artifacts_exist(projects)), 1):
+        m = hooksmod.ProjectManifest.load(Path(p["dir"]))
+        built = "✔" if exists else "✖"
+        d = str(p["dir"])
+        rel = d[len(ws_prefix):] if d.startswith(ws_prefix) else d
+        if m:
+            colour = "yellow" if m.project_type == "application" else "blue"
+            gav    = f"{m.group_id}:{m.artifact_id}:{m.version}"
+            deps   = ", ".join(d["artifactId"] for d in m.workspace_deps) or "—"
+            rows.append((str(i), p["name"], f"[{colour}]{m.project_type}[/{colour}]",
+                         gav, deps, built, rel))
+        else:
+            missing = "[dim]no project.json[/dim]"
+            rows.append((str(i), p["name"], missing, missing, missing, built, rel))
+
+    _print_table(f"Projects  ({len(projects)}  in build order)", [
+        ("#",     3,    {"justify": "right", "style": "dim"}),
+        ("Name",  16,   {"style": "bold cyan", "no_wrap": True}),
+        ("Type",  None, {"style": "bold"}),
+        ("G:A:V", 40,   {"style": "dim"}),
+        ("Deps",  None, {"style": "dim"}),
+        ("Built", 0,    {"justify": "center"}),
+        ("Dir",   None, {"style": "dim", "overflow": "fold"}),
+    ], rows)
     return 0
 
 
@@ -758,6 +968,35 @@ def cmd_project_show(args: argparse.Namespace) -> int:
     return 0
 
 
+def _read_pom_identity(pom: Path) -> tuple[str, str, str]:
+    """
+    Return ``(groupId, artifactId, version)`` declared directly under the
+    pom's ``<project>`` element (empty strings when absent).
+
+    The pom is streamed with ``iterparse`` and parsing stops as soon as all
+    three elements were seen, so large poms are never fully materialised.
+    """
+    wanted = ("groupId", "artifactId", "version")
+    found: dict[str, str] = {}
+    depth = 0
+    with open(pom, "rb") as fh:
+        for event, el in ET.iterparse(fh, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            # A direct child of <project> is complete – keep it or drop it
+            tag = el.tag.rpartition("}")[2]
+            if tag in wanted:
+                found[tag] = (el.text or "").strip()
+                if len(found) == len(wanted):
+                    break
+            el.clear()
+    return found.get("groupId", ""), found.get("artifactId", ""), found.get("version", "")
+
+
 def cmd_project_init(args: argparse.Namespace) -> int:
     """
     Create a starter project.json in a directory.
@@ -771,10 +1010,9 @@ def cmd_project_init(args: argparse.Namespace) -> int:
     target_dir = None  # type: Path | None
 
     # Try to resolve as a project name first
-    projects = cfg.get_projects()
-    by_name = {p["name"].lower(): Path(p["dir"]) for p in projects}
-    if args.dir.lower() in by_name:
-        target_dir = by_name[args.dir.lower()]
+    project = cfg.find_project(args.dir)
+    if project is not None:
+        target_dir = Path(project["dir"])
     else:
         candidate = Path(args.dir).expanduser().resolve()
         if candidate.is_dir():
@@ -795,12 +1033,7 @@ def cmd_project_init(args: argparse.Namespace) -> int:
     group_id = artifact_id = version = ""
     if pom.exists():
         try:
-            import xml.etree.ElementTree as _ET
-            root = _ET.parse(str(pom)).getroot()
-            ns   = "http://maven.apache.org/POM/4.0.0"
-            group_id    = (root.findtext(f"{{{ns}}}groupId")    or "").strip()
-            artifact_id = (root.findtext(f"{{{ns}}}artifactId") or "").strip()
-            version     = (root.findtext(f"{{{ns}}}version")    or "").strip()
+            group_id, artifact_id, version = _read_pom_identity(pom)
         except Exception:
             pass
 
@@ -818,12 +1051,13 @@ def cmd_project_init(args: argparse.Namespace) -> int:
         },
         "workspace_dependencies": [],
     }
-    dest.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    payload = fs.dumps_json(data)
+    dest.write_bytes(payload)
     log.success(f"Created {dest}")
-    print(dest.read_text(encoding="utf-8"))
+    print(payload.decode("utf-8"))
 
     # Invalidate the project cache so subsequent commands see the new project
-    cfg._projects_cache = None
+    cfg.invalidate_projects()
 
     # Sync root pom.xml so the new module appears in <modules>
     _sync_root_pom_from_workspace()
@@ -841,7 +1075,7 @@ def _sync_root_pom_from_workspace() -> bool:
 
     Returns ``True`` on success.
     """
-    cfg._projects_cache = None   # ensure fresh scan
+    cfg.invalidate_projects()   # ensure fresh scan
     all_manifests: dict = {}
     for entry in sorted(cfg.WORKSPACE.iterdir()):
         if not entry.is_dir():
@@ -857,6 +1091,19 @@ def _sync_root_pom_from_workspace() -> bool:
     return hooksmod.sync_root_pom(cfg.WORKSPACE, all_manifests)
 
 
+def _workspace_manifests() -> dict[str, "hooksmod.ProjectManifest"]:
+    """Return ``{artifactId: manifest}`` for every scanned workspace project."""
+    all_manifests: dict[str, hooksmod.ProjectManifest] = {}
+    for p in cfg.get_projects():
+        try:
+            m = hooksmod.ProjectManifest.load(Path(p["dir"]))
+        except ValueError:
+            m = None
+        if m is not None:
+            all_manifests[m.artifact_id] = m
+    return all_manifests
+
+
 def _sync_poms_after_manifest_change(changed_manifest: "hooksmod.ProjectManifest") -> None:
     """
     After a project.json is saved, patch pom.xml files to keep versions in sync:
@@ -864,40 +1111,48 @@ def _sync_poms_after_manifest_change(changed_manifest: "hooksmod.ProjectManifest
     1. The changed project's own pom.xml  (its identity block: groupId/artifactId/version).
     2. Every other workspace project whose workspace_dependencies include the
        changed project  (so their <dependency> version is updated too).
+
+    Dependents are looked up in the scan's reverse-dependency index, so only
+    the affected poms are touched.
     """
-    cfg._projects_cache = None   # force re-scan with fresh manifests
+    cfg.invalidate_projects()   # force re-scan with fresh manifests
 
-    # Build a full {artifactId: manifest} map from the current workspace
-    workspace = cfg.WORKSPACE
-    all_manifests: dict[str, hooksmod.ProjectManifest] = {}
-    for entry in sorted(workspace.iterdir()):
-        if not entry.is_dir():
-            continue
+    all_manifests = _workspace_manifests()
+    dependents    = cfg.get_project_set().rdeps.get(changed_manifest.artifact_id, set())
+
+    # Phase 1: render every pending pom edit in memory
+    #   a. the changed project's own pom
+    #   b. every dependent project (in build order)
+    targets = [changed_manifest] + [
+        m for aid, m in all_manifests.items()
+        if aid in dependents and aid != changed_manifest.artifact_id
+    ]
+    edits = []
+    for m in targets:
+        edit = hooksmod.render_pom_versions(m.path.parent, all_manifests)
+        if edit is not None:
+            edits.append((m.name, edit))
+
+    # Phase 2: commit them with atomic replaces
+    def _flush(item) -> bool:
+        name, (pom_path, text) = item
         try:
-            m = hooksmod.ProjectManifest.load(entry)
-        except ValueError:
-            m = None
-        if m is not None:
-            all_manifests[m.artifact_id] = m
+            fs.write_atomic(pom_path, text)
+            return True
+        except OSError as exc:
+            log.error(f"Failed to write {pom_path}: {exc}")
+            return False
 
     patched = []
-
-    # 1. Patch the changed project's own pom
-    if hooksmod.sync_pom_versions(changed_manifest.path.parent, all_manifests):
-        patched.append(changed_manifest.name)
+    if edits:
+        with ThreadPoolExecutor(max_workers=min(8, len(edits))) as pool:
+            for (name, _), ok in zip(edits, pool.map(_flush, edits)):
+                if ok:
+                    patched.append(name)
 
     # Sync module.json if the project has a module block
     hooksmod.sync_module_json(changed_manifest)
 
-    # 2. Patch every dependent project
-    for aid, m in all_manifests.items():
-        if m.artifact_id == changed_manifest.artifact_id:
-            continue
-        dep_ids = {d.get("artifactId") for d in m.workspace_deps}
-        if changed_manifest.artifact_id in dep_ids:
-            if hooksmod.sync_pom_versions(m.path.parent, all_manifests):
-                patched.append(m.name)
-
     if patched:
         log.success(f"pom.xml synced: {', '.join(patched)}")
 
@@ -938,10 +1193,10 @@ def cmd_project_set(args: argparse.Namespace) -> int:
         )
         return 1
 
-    manifest.save()
+    serialized = manifest.save()
     _sync_poms_after_manifest_change(manifest)
     log.success(f"Updated {manifest.path.name}:  {field_name} = {value}")
-    print(manifest.path.read_text(encoding="utf-8"))
+    print(serialized)
     return 0
 
 
@@ -951,17 +1206,17 @@ def cmd_project_add_dep(args: argparse.Namespace) -> int:
     if manifest is None:
         return 1
 
-    new_dep = {"groupId": args.group_id, "artifactId": args.artifact_id}
-    for dep in manifest.workspace_deps:
-        if dep["groupId"] == new_dep["groupId"] and dep["artifactId"] == new_dep["artifactId"]:
-            log.warn(f"Dependency {args.group_id}:{args.artifact_id} already declared.")
-            return 0
+    key      = (args.group_id, args.artifact_id)
+    existing = {(d.get("groupId"), d.get("artifactId")) for d in manifest.workspace_deps}
+    if key in existing:
+        log.warn(f"Dependency {args.group_id}:{args.artifact_id} already declared.")
+        return 0
 
-    manifest.workspace_deps.append(new_dep)
-    manifest.save()
+    manifest.workspace_deps.append({"groupId": args.group_id, "artifactId": args.artifact_id})
+    serialized = manifest.save()
     _sync_poms_after_manifest_change(manifest)
     log.success(f"Added workspace dep {args.group_id}:{args.artifact_id} to {manifest.name}")
-    print(manifest.path.read_text(encoding="utf-8"))
+    print(serialized)
     return 0
 
 
@@ -971,26 +1226,14 @@ def cmd_project_remove_dep(args: argparse.Namespace) -> int:
     if manifest is None:
         return 1
 
-    before = len(manifest.workspace_deps)
-    removed_deps = [
-        d for d in manifest.workspace_deps
-        if d["artifactId"] == args.artifact_id
-        and (args.group_id is None or d["groupId"] == args.group_id)
-    ]
-    manifest.workspace_deps = [
-        d for d in manifest.workspace_deps
-        if not (
-            d["artifactId"] == args.artifact_id
-            and (args.group_id is None or d["groupId"] == args.group_id)
-        )
-    ]
-    if len(manifest.workspace_deps) == before:
+    removed_deps = manifest.remove_deps(args.artifact_id, args.group_id)
+    if not removed_deps:
         log.warn(f"Dependency '{args.artifact_id}' not found in {manifest.name}.")
         return 1
-    manifest.save()
+    serialized = manifest.save()
 
     # Also remove the <dependency> block from pom.xml
-    dep_group_id = args.group_id or (removed_deps[0]["groupId"] if removed_deps else None)
+    dep_group_id = args.group_id or removed_deps[0]["groupId"]
     pom_removed = hooksmod.remove_pom_dependency(
         manifest.path.parent, dep_group_id, args.artifact_id
     )
@@ -1001,7 +1244,7 @@ def cmd_project_remove_dep(args: argparse.Namespace) -> int:
 
     _sync_poms_after_manifest_change(manifest)
     log.success(f"Removed workspace dep '{args.artifact_id}' from {manifest.name}")
-    print(manifest.path.read_text(encoding="utf-8"))
+    print(serialized)
     return 0
 
 
@@ -1025,24 +1268,16 @@ def cmd_project_sync_root_pom(args: argparse.Namespace) -> int:
 
 def cmd_project_run(args: argparse.Namespace) -> int:
     """Dry-run pre-build hooks for a specific project (hook-init, no Maven build)."""
-    mode   = args.mode or cfg.BUILD_MODE
-    target = args.project
-
-    projects = cfg.get_projects()
-    matched = [p for p in projects if p["name"].lower() == target.lower()]
-    if not matched:
-        names = ", ".join(p["name"] for p in projects)
-        log.error(f"Project '{target}' not found. Available: {names}")
+    mode    = args.mode
+    project = _lookup_project(args.project)
+    if project is None:
         return 1
 
-    project = matched[0]
     log.banner(
         f"Project hooks – {project['name']}",
         f"mode: {mode}  |  phase: {args.phase}",
     )
 
-    ctx = hooksmod.build_hook_context(project, mode=mode, verbose=args.verbose,
-                                      workspace_dir=cfg.WORKSPACE)
     hook_table = _universal_hooks()
     fns = hook_table.get(args.phase, [])
 
@@ -1050,6 +1285,9 @@ def cmd_project_run(args: argparse.Namespace) -> int:
         log.warn(f"No {args.phase} hooks for '{project['name']}'.")
         return 0
 
+    ctx = hooksmod.build_hook_context(project, mode=mode, verbose=args.verbose,
+                                      workspace_dir=cfg.WORKSPACE)
+
     ok, pom_override, extra_mvn_args = hooksmod.run_hooks(args.phase, fns, ctx)
     if ok:
         if pom_override:
@@ -1066,6 +1304,7 @@ def cmd_project_run(args: argparse.Namespace) -> int:
 
 def cmd_sdk_list(args: argparse.Namespace) -> int:
     """List locally installed Java candidates known to sdkman."""
+    import sdkman  # lazy import
     log.banner("sdkman – Installed Java Candidates")
     if not sdkman.is_available():
         log.error("sdkman is not installed (expected at ~/.sdkman).")
@@ -1076,6 +1315,7 @@ def cmd_sdk_list(args: argparse.Namespace) -> int:
 
 def cmd_sdk_install(args: argparse.Namespace) -> int:
     """Install a Java candidate via sdkman."""
+    import sdkman  # lazy import
     if not sdkman.is_available():
         log.error("sdkman is not installed (expected at ~/.sdkman).")
         return 1
@@ -1088,6 +1328,7 @@ def cmd_sdk_use(args: argparse.Namespace) -> int:
     Switch the default sdkman Java candidate AND update JAVA_VERSION in config
     for this session. Prints the export command to make it permanent.
     """
+    import sdkman  # lazy import
     if not sdkman.is_available():
         log.error("sdkman is not installed (expected at ~/.sdkman).")
         return 1
@@ -1118,180 +1359,299 @@ def cmd_sdk_use(args: argparse.Namespace) -> int:
 # idea command – generate IntelliJ IDEA monorepo project files
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _pretty_xml(element: ET.Element) -> str:
-    """Return a pretty-printed XML string for the element."""
-    raw = ET.tostring(element, encoding="unicode")
-    dom = minidom.parseString(raw)
-    lines = dom.toprettyxml(indent="  ").splitlines()
-    # minidom adds an XML declaration on line 0; keep it
-    return "\n".join(lines) + "\n"
+# The fixed-shape .idea files are written from templates – building an
+# ElementTree and pretty-printing it is not worth it for two elements.
+_VCS_XML = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<project version="4">
+  <component name="VcsDirectoryMappings">
+    <mapping directory="$PROJECT_DIR$" vcs="Git"/>
+  </component>
+</project>
+"""
+
+_ENCODINGS_XML = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<project version="4">
+  <component name="Encoding" addBOMForNewFiles=";UTF-8:with NO BOM" defaultCharsetForPropertiesFiles="UTF-8"/>
+</project>
+"""
+
+_MISC_XML_FMT = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<project version="4">
+  <component name="Black">
+    <option name="sdkName" value="Python 3.13"/>
+  </component>
+  <component name="ProjectRootManager" version="2" languageLevel={level} project-jdk-name={jdk} project-jdk-type="JavaSDK">
+    <output url="file://$PROJECT_DIR$/out"/>
+  </component>
+</project>
+"""
+
+# modules.xml only varies in its list of <module> entries
+_MODULES_XML_FMT = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<project version="4">
+  <component name="ProjectModuleManager">
+    <modules>
+{modules}    </modules>
+  </component>
+</project>
+"""
+
+_MODULE_ENTRY_FMT = '      <module fileurl={url} filepath={path}{group}/>\n'
+
+_COMPILER_XML_FMT = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<project version="4">
+  <component name="CompilerConfiguration">
+    <bytecodeTargetLevel target={target}/>
+  </component>
+</project>
+"""
+
+
+def _java_major(version: str) -> str:
+    """Return the major version of a Java/sdkman identifier ('24.0.2-tem' → '24')."""
+    return version.partition(".")[0].partition("-")[0]
+
+
+_POM_NS_MAP = {"m": "http://maven.apache.org/POM/4.0.0"}
+
+_IML_XML_FMT = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<module type="JAVA_MODULE" version="4">
+  <component name="NewModuleRootManager" inherit-compiler-output="true">
+    <exclude-output/>
+{content}    <orderEntry type="inheritedJdk"/>
+    <orderEntry type="sourceFolder" forTests="false"/>
+  </component>
+</module>
+"""
+
+_IML_CONTENT_FMT = """\
+    <content url="file://$MODULE_DIR$">
+{folders}    </content>
+"""
+
+_IML_CONTENT_EMPTY = '    <content url="file://$MODULE_DIR$"/>\n'
+
+_IML_MAIN_JAVA      = '      <sourceFolder url="file://$MODULE_DIR$/src/main/java" isTestSource="false"/>\n'
+_IML_MAIN_RES       = '      <sourceFolder url="file://$MODULE_DIR$/src/main/resources" type="java-resource"/>\n'
+_IML_TEST_JAVA_FMT  = '      <sourceFolder url={url} isTestSource="true"/>\n'
+_IML_TEST_RES       = '      <sourceFolder url="file://$MODULE_DIR$/src/test/resources" type="java-test-resource"/>\n'
+_IML_EXCLUDE_TARGET = '      <excludeFolder url="file://$MODULE_DIR$/target"/>\n'
+
+
+def _test_source_dir(project_dir: Path) -> str:
+    """Return the module's test source directory, honouring a custom ``<testSourceDirectory>``."""
+    try:
+        pom_root = ET.parse(project_dir / "pom.xml").getroot()
+    except ET.ParseError:
+        return "src/test/java"
+    # Try with namespace first, then without
+    tsd = pom_root.find(".//m:testSourceDirectory", _POM_NS_MAP)
+    if tsd is None:
+        tsd = pom_root.find(".//testSourceDirectory")
+    if tsd is not None and tsd.text:
+        return tsd.text.strip()
+    return "src/test/java"   # Maven default
+
+
+def _iml_xml(project_dir: Path) -> str:
+    """
+    Render the ``.iml`` module file for a Maven sub-project.
+
+    The module layout is fixed, so the file is assembled from template
+    strings; only the source folders that exist on disk are included.
+    """
+    from xml.sax.saxutils import quoteattr  # lazy import
+
+    has_pom = (project_dir / "pom.xml").exists()
+
+    folders = []
+    if (project_dir / "src" / "main" / "java").exists():
+        folders.append(_IML_MAIN_JAVA)
+    if (project_dir / "src" / "main" / "resources").exists():
+        folders.append(_IML_MAIN_RES)
+
+    test_src_rel = _test_source_dir(project_dir) if has_pom else "src/test/java"
+    if (project_dir / test_src_rel).exists():
+        folders.append(_IML_TEST_JAVA_FMT.format(url=quoteattr(f"file://$MODULE_DIR$/{test_src_rel}")))
+
+    # Test resources (standard Maven layout only)
+    if (project_dir / "src" / "test" / "resources").exists():
+        folders.append(_IML_TEST_RES)
+    if has_pom:
+        folders.append(_IML_EXCLUDE_TARGET)
+
+    content = _IML_CONTENT_FMT.format(folders="".join(folders)) if folders else _IML_CONTENT_EMPTY
+    return _IML_XML_FMT.format(content=content)
+
+
+_IDEA_DONE_MSG = """\
+Open the workspace root in IntelliJ IDEA:
+  File → Open → {workspace}
+Then: File → Project Structure → Modules to verify all {count} modules.
+If prompted, import Maven projects from the pom.xml files in each module."""
+
+
+def _log_idea_results(results: list[tuple[str, Optional[bool]]]) -> None:
+    """Log one line per generated IDEA file (``None`` = skipped, else written?)."""
+    for label, written in results:
+        if written is None:
+            log.info(f"Skipping (already exists): {label}")
+        elif written:
+            log.success(f"Written: {label}")
+        else:
+            log.info(f"Unchanged: {label}")
 
 
 def cmd_idea(args: argparse.Namespace) -> int:
     """Generate / refresh IntelliJ IDEA .idea monorepo project files."""
+    import hashlib  # lazy import
+    from xml.sax.saxutils import quoteattr
     log.banner("IDEA Project Setup", "Generating IntelliJ IDEA monorepo configuration")
 
     idea_dir = cfg.WORKSPACE / ".idea"
     idea_dir.mkdir(exist_ok=True)
+    # One directory read instead of a stat() per .idea file below
+    with os.scandir(idea_dir) as it:
+        idea_files = {e.name for e in it}
+
+    ws_name = cfg.WORKSPACE.name
+    pdir    = "$PROJECT_DIR$"
 
-    java_ver = args.java_version or cfg.JAVA_VERSION or "24"
-    java_major = java_ver.split(".")[0].split("-")[0]
+    java_ver = args.java_version or "24"
+    java_major = _java_major(java_ver)
     lang_level = f"JDK_{java_major}"
 
-    # Discover Maven modules dynamically
+    # Discover Maven modules dynamically: (name, dir, workspace-relative posix path)
     maven_modules = [
-        (p["name"], Path(p["dir"]))
+        (p["name"], Path(p["dir"]),
+         os.path.relpath(p["dir"], cfg.WORKSPACE).replace(os.sep, "/"))
         for p in cfg.get_projects()
     ]
 
+    # ── up-to-date check ─────────────────────────────────────────────────────
+    # Everything generated below is a function of these inputs.  The stamp
+    # also records the mtime/size of the files that are always rewritten, so
+    # a hand-edited or deleted one is regenerated; if the inputs match the
+    # last run and every file is untouched, there is nothing to do.
+    stamp_path = cfg.BUILD_DIR / ".build-cache" / "idea.stamp"
+    inputs = hashlib.blake2b(
+        repr(("idea-v1", ws_name, java_major,
+              [(name, rel) for name, _, rel in maven_modules])).encode(),
+        digest_size=16,
+    ).hexdigest()
+
+    def _stamp() -> Optional[str]:
+        outputs = []
+        for fname in ("modules.xml", "misc.xml", "compiler.xml"):
+            try:
+                st = (idea_dir / fname).stat()
+            except OSError:
+                return None
+            outputs.append(f"{fname} {st.st_mtime_ns} {st.st_size}")
+        return "\n".join([inputs, *outputs]) + "\n"
+
+    if not args.force:
+        try:
+            previous = stamp_path.read_text(encoding="utf-8")
+        except OSError:
+            previous = None
+        if (
+            previous is not None
+            and previous == _stamp()
+            and idea_files.issuperset(("vcs.xml", "encodings.xml"))
+            and all((project_dir / f"{name}.iml").exists()
+                    for name, project_dir, _ in maven_modules)
+        ):
+            log.info("All IDEA files are up to date; use --force to regenerate.")
+            return 0
+
+    # (label, written?) per generated file – None means skipped.  Logged as a
+    # single summary at the end; --verbose lists every file.
+    results: list[tuple[str, Optional[bool]]] = []
+
+    def _write_idea_file(path: Path, text: str) -> None:
+        results.append((f".idea/{path.name}", fs.write_if_changed(path, text)))
+
     # ── modules.xml ──────────────────────────────────────────────────────────
-    project_el = ET.Element("project", version="4")
-    mgr = ET.SubElement(project_el, "component", name="ProjectModuleManager")
-    modules_el = ET.SubElement(mgr, "modules")
-
-    # Build module (Python)
-    build_iml = "$PROJECT_DIR$/Build/Build.iml"
-    ET.SubElement(modules_el, "module",
-                  fileurl=f"file://{build_iml}",
-                  filepath=build_iml)
-
-    # Root IDEA module
-    root_iml = f"$PROJECT_DIR$/.idea/{cfg.WORKSPACE.name}.iml"
-    ET.SubElement(modules_el, "module",
-                  fileurl=f"file://{root_iml}",
-                  filepath=root_iml)
-
-    # Maven sub-projects
-    for name, project_dir in maven_modules:
-        rel = project_dir.relative_to(cfg.WORKSPACE)
-        iml_rel = f"$PROJECT_DIR$/{rel}/{name}.iml"
-        ET.SubElement(modules_el, "module",
-                      fileurl=f"file://{iml_rel}",
-                      filepath=iml_rel,
-                      group="Maven Projects")
+    def _module_entry(iml: str, group: str = "") -> str:
+        return _MODULE_ENTRY_FMT.format(
+            url=quoteattr(f"file://{iml}"), path=quoteattr(iml),
+            group=f" group={quoteattr(group)}" if group else "",
+        )
+
+    # Build module (Python), root IDEA module, then the Maven sub-projects
+    entries = [
+        _module_entry(f"{pdir}/Build/Build.iml"),
+        _module_entry(f"{pdir}/.idea/{ws_name}.iml"),
+    ]
+    entries += [
+        _module_entry(f"{pdir}/{rel}/{name}.iml", "Maven Projects")
+        for name, _, rel in maven_modules
+    ]
 
     modules_xml_path = idea_dir / "modules.xml"
-    modules_xml_path.write_text(_pretty_xml(project_el), encoding="utf-8")
-    log.success(f"Written: {modules_xml_path.relative_to(cfg.WORKSPACE)}")
+    _write_idea_file(modules_xml_path, _MODULES_XML_FMT.format(modules="".join(entries)))
 
     # ── misc.xml ─────────────────────────────────────────────────────────────
-    misc_el = ET.Element("project", version="4")
-    black = ET.SubElement(misc_el, "component", name="Black")
-    opt = ET.SubElement(black, "option", name="sdkName")
-    opt.set("value", "Python 3.13")
-    root_mgr = ET.SubElement(misc_el, "component",
-                              name="ProjectRootManager",
-                              version="2",
-                              languageLevel=lang_level,
-                              **{"project-jdk-name": f"Java {java_major}",
-                                 "project-jdk-type": "JavaSDK"})
-    ET.SubElement(root_mgr, "output", url="file://$PROJECT_DIR$/out")
     misc_xml_path = idea_dir / "misc.xml"
-    misc_xml_path.write_text(_pretty_xml(misc_el), encoding="utf-8")
-    log.success(f"Written: {misc_xml_path.relative_to(cfg.WORKSPACE)}")
+    _write_idea_file(misc_xml_path, _MISC_XML_FMT.format(
+        level=quoteattr(lang_level), jdk=quoteattr(f"Java {java_major}"),
+    ))
 
     # ── .iml files for each Maven sub-project ────────────────────────────────
-    for name, project_dir in maven_modules:
+    # Every module is independent, so render + write them on a thread pool and
+    # record the outcomes afterwards, in module order.
+    def _iml_job(module: tuple) -> Optional[bool]:
+        name, project_dir, _ = module
         iml_path = project_dir / f"{name}.iml"
         if iml_path.exists() and not args.force:
-            log.info(f"Skipping (already exists): {iml_path.relative_to(cfg.WORKSPACE)}")
-            continue
-        iml_el = ET.Element("module", type="JAVA_MODULE", version="4")
-        root_mgr_el = ET.SubElement(iml_el, "component",
-                                     name="NewModuleRootManager",
-                                     **{"inherit-compiler-output": "true"})
-        ET.SubElement(root_mgr_el, "exclude-output")
-        content = ET.SubElement(root_mgr_el, "content", url="file://$MODULE_DIR$")
-
-        has_pom = (project_dir / "pom.xml").exists()
-
-        # ── source folders ────────────────────────────────────────────────────
-        # Main sources
-        main_java = project_dir / "src" / "main" / "java"
-        if main_java.exists():
-            ET.SubElement(content, "sourceFolder",
-                          url="file://$MODULE_DIR$/src/main/java",
-                          isTestSource="false")
-
-        # Main resources
-        main_res = project_dir / "src" / "main" / "resources"
-        if main_res.exists():
-            ET.SubElement(content, "sourceFolder",
-                          url="file://$MODULE_DIR$/src/main/resources",
-                          type="java-resource")
-
-        # Test sources – read custom <testSourceDirectory> from pom.xml if present
-        test_src_rel = "src/test/java"  # Maven default
-        if has_pom:
-            try:
-                pom_tree = ET.parse(project_dir / "pom.xml")
-                pom_root = pom_tree.getroot()
-                ns = {"m": "http://maven.apache.org/POM/4.0.0"}
-                # Try with namespace first, then without
-                tsd = pom_root.find(".//m:testSourceDirectory", ns)
-                if tsd is None:
-                    tsd = pom_root.find(".//testSourceDirectory")
-                if tsd is not None and tsd.text:
-                    test_src_rel = tsd.text.strip()
-            except ET.ParseError:
-                pass
-
-        test_src = project_dir / test_src_rel
-        if test_src.exists():
-            ET.SubElement(content, "sourceFolder",
-                          url=f"file://$MODULE_DIR$/{test_src_rel}",
-                          isTestSource="true")
-
-        # Test resources (standard Maven layout only)
-        test_res = project_dir / "src" / "test" / "resources"
-        if test_res.exists():
-            ET.SubElement(content, "sourceFolder",
-                          url="file://$MODULE_DIR$/src/test/resources",
-                          type="java-test-resource")
-
-        if has_pom:
-            ET.SubElement(content, "excludeFolder", url="file://$MODULE_DIR$/target")
-
-        ET.SubElement(root_mgr_el, "orderEntry", type="inheritedJdk")
-        ET.SubElement(root_mgr_el, "orderEntry", type="sourceFolder", forTests="false")
-        iml_path.write_text(_pretty_xml(iml_el), encoding="utf-8")
-        log.success(f"Written: {iml_path.relative_to(cfg.WORKSPACE)}")
+            return None
+        return fs.write_if_changed(iml_path, _iml_xml(project_dir))
+
+    if maven_modules:
+        with ThreadPoolExecutor(max_workers=min(32, len(maven_modules))) as pool:
+            outcomes = list(pool.map(_iml_job, maven_modules))
+        results.extend(
+            (f"{rel}/{name}.iml", written)
+            for (name, _, rel), written in zip(maven_modules, outcomes)
+        )
 
     # ── vcs.xml ──────────────────────────────────────────────────────────────
     vcs_path = idea_dir / "vcs.xml"
-    if not vcs_path.exists() or args.force:
-        vcs_el = ET.Element("project", version="4")
-        vcs_comp = ET.SubElement(vcs_el, "component", name="VcsDirectoryMappings")
-        ET.SubElement(vcs_comp, "mapping", directory="$PROJECT_DIR$", vcs="Git")
-        vcs_path.write_text(_pretty_xml(vcs_el), encoding="utf-8")
-        log.success(f"Written: {vcs_path.relative_to(cfg.WORKSPACE)}")
+    if "vcs.xml" not in idea_files or args.force:
+        _write_idea_file(vcs_path, _VCS_XML)
 
     # ── encodings.xml ─────────────────────────────────────────────────────────
     enc_path = idea_dir / "encodings.xml"
-    if not enc_path.exists() or args.force:
-        enc_el = ET.Element("project", version="4")
-        ET.SubElement(enc_el, "component",
-                      name="Encoding",
-                      addBOMForNewFiles=";UTF-8:with NO BOM",
-                      defaultCharsetForPropertiesFiles="UTF-8")
-        enc_path.write_text(_pretty_xml(enc_el), encoding="utf-8")
-        log.success(f"Written: {enc_path.relative_to(cfg.WORKSPACE)}")
+    if "encodings.xml" not in idea_files or args.force:
+        _write_idea_file(enc_path, _ENCODINGS_XML)
 
     # ── compiler.xml ──────────────────────────────────────────────────────────
     compiler_path = idea_dir / "compiler.xml"
-    comp_el = ET.Element("project", version="4")
-    compiler_comp = ET.SubElement(comp_el, "component", name="CompilerConfiguration")
-    ET.SubElement(compiler_comp, "bytecodeTargetLevel", **{"target": java_major})
-    compiler_path.write_text(_pretty_xml(comp_el), encoding="utf-8")
-    log.success(f"Written: {compiler_path.relative_to(cfg.WORKSPACE)}")
+    _write_idea_file(compiler_path, _COMPILER_XML_FMT.format(target=quoteattr(java_major)))
+
+    if args.verbose:
+        _log_idea_results(results)
+    written   = sum(1 for _, w in results if w)
+    unchanged = sum(1 for _, w in results if w is False)
+    skipped   = len(results) - written - unchanged
+    log.success(
+        f"Wrote {written} IDEA file(s) "
+        f"({unchanged} unchanged, {skipped} skipped)"
+    )
+
+    stamp_path.parent.mkdir(parents=True, exist_ok=True)
+    fs.write_atomic(stamp_path, _stamp() or "")
 
     log.banner(
         "Done",
-        textwrap.dedent(f"""\
-        Open the workspace root in IntelliJ IDEA:
-          File → Open → {cfg.WORKSPACE}
-        Then: File → Project Structure → Modules to verify all {len(maven_modules)} modules.
-        If prompted, import Maven projects from the pom.xml files in each module.""")
+        _IDEA_DONE_MSG.format(workspace=cfg.WORKSPACE, count=len(maven_modules)),
     )
     return 0
 
@@ -1302,7 +1662,7 @@ def cmd_idea(args: argparse.Namespace) -> int:
 
 def _add_java_version_arg(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
-        "--java-version", metavar="ID", default=None,
+        "--java-version", metavar="ID", default=cfg.JAVA_VERSION,
         help=(
             f"sdkman Java candidate to use, e.g. '24.0.2-tem' "
             f"(default: {cfg.JAVA_VERSION or 'ambient PATH'}). "
@@ -1313,7 +1673,7 @@ def _add_java_version_arg(parser: argparse.ArgumentParser) -> None:
 
 def _add_mode_arg(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
-        "--mode", metavar="MODE", default=None,
+        "--mode", metavar="MODE", default=cfg.BUILD_MODE,
         choices=["local", "devel", "release"],
         help=(
             "Build mode passed to pre-build hooks "
@@ -1325,19 +1685,8 @@ def _add_mode_arg(parser: argparse.ArgumentParser) -> None:
     )
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="build",
-        description="Islands Build Automation CLI",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=__doc__,
-    )
-    parser.add_argument("--version", action="version", version="islands-build 1.0.0")
-
-    sub = parser.add_subparsers(dest="command", metavar="<command>")
-    sub.required = True
-
-    # ── build-all ─────────────────────────────────────────────────────────────
+# ── build-all ────────────────────────────────────────────────────────────────
+def _add_build_all_parser(sub: argparse._SubParsersAction) -> None:
     p_build = sub.add_parser(
         "build-all",
         help="Build all projects (ModularKit → CoffeeLoader → Islands)",
@@ -1349,11 +1698,25 @@ def build_parser() -> argparse.ArgumentParser:
         help="Run 'mvn clean install' instead of 'mvn install' (default: no clean)")
     p_build.add_argument("--verbose", "-v", action="store_true",
         help="Show full Maven output (removes --batch-mode)")
+    p_build.add_argument("--no-incremental", dest="incremental", action="store_false",
+        help="Rebuild every project even if its sources are unchanged "
+             "(unlike --clean, keeps target/ and the hash cache)")
+    p_build.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+        help="Build up to N independent projects concurrently; their Maven "
+             "output interleaves on the terminal (default: 1 = sequential; "
+             "0 = number of CPUs)")
+    p_build.add_argument("--no-mvnd", dest="mvnd", action="store_false",
+        help="Always use 'mvn', even when the Maven Daemon (mvnd) is installed")
+    p_build.add_argument("--maven-threads", "-T", metavar="N", dest="maven_threads",
+        help="Pass '-T N' to every Maven build to build a project's modules in "
+             "parallel, e.g. 4 or 1C (default: Maven's own, single-threaded)")
     _add_java_version_arg(p_build)
     _add_mode_arg(p_build)
     p_build.set_defaults(func=cmd_build_all)
 
-    # ── run ───────────────────────────────────────────────────────────────────
+
+# ── run ──────────────────────────────────────────────────────────────────────
+def _add_run_parser(sub: argparse._SubParsersAction) -> None:
     p_run = sub.add_parser(
         "run",
         help="Build all, assemble output dir, then launch Islands via CoffeeLoader",
@@ -1394,7 +1757,9 @@ def build_parser() -> argparse.ArgumentParser:
     _add_mode_arg(p_run)
     p_run.set_defaults(func=cmd_run_islands)
 
-    # ── assemble ──────────────────────────────────────────────────────────────
+
+# ── assemble ─────────────────────────────────────────────────────────────────
+def _add_assemble_parser(sub: argparse._SubParsersAction) -> None:
     p_asm = sub.add_parser(
         "assemble",
         help="Copy built artifacts into output/ without rebuilding",
@@ -1403,11 +1768,15 @@ def build_parser() -> argparse.ArgumentParser:
         help="Wipe the output directory before assembling (default: keep existing contents)")
     p_asm.set_defaults(func=cmd_assemble)
 
-    # ── clean ─────────────────────────────────────────────────────────────────
+
+# ── clean ────────────────────────────────────────────────────────────────────
+def _add_clean_parser(sub: argparse._SubParsersAction) -> None:
     p_clean = sub.add_parser("clean", help="Delete the output/ directory")
     p_clean.set_defaults(func=cmd_clean)
 
-    # ── cache ─────────────────────────────────────────────────────────────────
+
+# ── cache ────────────────────────────────────────────────────────────────────
+def _add_cache_parser(sub: argparse._SubParsersAction) -> None:
     p_cache = sub.add_parser(
         "cache",
         help="Manage the source-hash build cache (status / clear / invalidate)",
@@ -1415,7 +1784,7 @@ def build_parser() -> argparse.ArgumentParser:
             "Inspect or clear the source-hash cache used to skip unchanged projects.\n\n"
             "Sub-commands:\n"
             "  status               show cache state for every project\n"
-            "  clear                wipe the entire cache (all projects will rebuild)\n"
+            "  clear                drop every stored fingerprint (all projects will rebuild)\n"
             "  invalidate <PROJECT> force a specific project to rebuild next time\n"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1426,22 +1795,28 @@ def build_parser() -> argparse.ArgumentParser:
     p_cache_status = cache_sub.add_parser("status", help="Show cache state for every project")
     p_cache_status.set_defaults(func=cmd_cache)
 
-    p_cache_clear = cache_sub.add_parser("clear", help="Wipe the entire build cache")
+    p_cache_clear = cache_sub.add_parser("clear", help="Drop every stored fingerprint")
     p_cache_clear.set_defaults(func=cmd_cache)
 
     p_cache_inv = cache_sub.add_parser("invalidate", help="Force a single project to rebuild")
     p_cache_inv.add_argument("project", metavar="PROJECT")
     p_cache_inv.set_defaults(func=cmd_cache)
 
-    # ── status ────────────────────────────────────────────────────────────────
+
+# ── status ───────────────────────────────────────────────────────────────────
+def _add_status_parser(sub: argparse._SubParsersAction) -> None:
     p_status = sub.add_parser("status", help="Show build status of each Maven artifact")
     p_status.set_defaults(func=cmd_status)
 
-    # ── info ──────────────────────────────────────────────────────────────────
+
+# ── info ─────────────────────────────────────────────────────────────────────
+def _add_info_parser(sub: argparse._SubParsersAction) -> None:
     p_info = sub.add_parser("info", help="Print resolved workspace paths and Java config")
     p_info.set_defaults(func=cmd_info)
 
-    # ── idea ──────────────────────────────────────────────────────────────────
+
+# ── idea ─────────────────────────────────────────────────────────────────────
+def _add_idea_parser(sub: argparse._SubParsersAction) -> None:
     p_idea = sub.add_parser(
         "idea",
         help="Generate / refresh IntelliJ IDEA .idea monorepo project files",
@@ -1457,10 +1832,16 @@ def build_parser() -> argparse.ArgumentParser:
         "--force", "-f", action="store_true",
         help="Overwrite existing .iml and helper files (default: skip if present)",
     )
+    p_idea.add_argument(
+        "--verbose", "-v", action="store_true",
+        help="List every generated file instead of a one-line summary",
+    )
     _add_java_version_arg(p_idea)
     p_idea.set_defaults(func=cmd_idea)
 
-    # ── git ───────────────────────────────────────────────────────────────────
+
+# ── git ──────────────────────────────────────────────────────────────────────
+def _add_git_parser(sub: argparse._SubParsersAction) -> None:
     p_git = sub.add_parser(
         "git",
         help="Git repository management across all repos",
@@ -1470,12 +1851,18 @@ def build_parser() -> argparse.ArgumentParser:
     git_sub = p_git.add_subparsers(dest="git_command", metavar="<git-command>")
     git_sub.required = True
 
+    def _add_jobs_arg(parser: argparse.ArgumentParser) -> None:
+        parser.add_argument("-j", "--jobs", type=int, default=gitutil.DEFAULT_JOBS, metavar="N",
+            help=f"Work on up to N repos concurrently (default: {gitutil.DEFAULT_JOBS})")
+
     # git status
     p_git_status = git_sub.add_parser("status", help="Show branch and working-tree status for all repos")
+    _add_jobs_arg(p_git_status)
     p_git_status.set_defaults(func=cmd_git_status)
 
     # git branches
     p_git_branches = git_sub.add_parser("branches", help="List all local branches for all repos")
+    _add_jobs_arg(p_git_branches)
     p_git_branches.set_defaults(func=cmd_git_branches)
 
     # git checkout
@@ -1488,14 +1875,18 @@ def build_parser() -> argparse.ArgumentParser:
     # git fetch
     p_git_fetch = git_sub.add_parser("fetch", help="Run 'git fetch --all --prune' on every repo")
     p_git_fetch.add_argument("--verbose", "-v", action="store_true")
+    _add_jobs_arg(p_git_fetch)
     p_git_fetch.set_defaults(func=cmd_git_fetch)
 
     # git pull
     p_git_pull = git_sub.add_parser("pull", help="Run 'git pull' on every repo")
     p_git_pull.add_argument("--verbose", "-v", action="store_true")
+    _add_jobs_arg(p_git_pull)
     p_git_pull.set_defaults(func=cmd_git_pull)
 
-    # ── repo (Google repo tool) ────────────────────────────────────────────────
+
+# ── repo (Google repo tool) ──────────────────────────────────────────────────
+def _add_repo_parser(sub: argparse._SubParsersAction) -> None:
     p_repo = sub.add_parser("repo", help="Google repo tool management")
     repo_sub = p_repo.add_subparsers(dest="repo_command", metavar="<repo-command>")
     repo_sub.required = True
@@ -1534,6 +1925,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_repo_sync.set_defaults(func=cmd_repo_sync)
     p_repo_forall = repo_sub.add_parser("forall")
     p_repo_forall.add_argument("cmd", metavar="COMMAND")
+    p_repo_forall.add_argument("-j", "--jobs", type=int, default=1, metavar="N",
+        help="Run the command in N projects at once (default: 1)")
     p_repo_forall.add_argument("--verbose", "-v", action="store_true")
     p_repo_forall.set_defaults(func=cmd_repo_forall)
     p_repo_co = repo_sub.add_parser("checkout")
@@ -1542,7 +1935,9 @@ def build_parser() -> argparse.ArgumentParser:
     p_repo_co.add_argument("--force",  "-f", action="store_true")
     p_repo_co.set_defaults(func=cmd_repo_checkout)
 
-    # ── project ───────────────────────────────────────────────────────────────
+
+# ── project ──────────────────────────────────────────────────────────────────
+def _add_project_parser(sub: argparse._SubParsersAction) -> None:
     p_proj = sub.add_parser(
         "project",
         help="Manage workspace projects and their project.json manifests",
@@ -1641,7 +2036,9 @@ def build_parser() -> argparse.ArgumentParser:
     _add_mode_arg(p_proj_run)
     p_proj_run.set_defaults(func=cmd_project_run)
 
-    # ── sdk ───────────────────────────────────────────────────────────────────
+
+# ── sdk ──────────────────────────────────────────────────────────────────────
+def _add_sdk_parser(sub: argparse._SubParsersAction) -> None:
     p_sdk = sub.add_parser("sdk", help="Manage Java installations via sdkman")
     sdk_sub = p_sdk.add_subparsers(dest="sdk_command", metavar="<sdk-command>")
     sdk_sub.required = True
@@ -1659,6 +2056,50 @@ def build_parser() -> argparse.ArgumentParser:
         help="Install the candidate first if not already available")
     p_sdk_use.set_defaults(func=cmd_sdk_use)
 
+
+# Top-level command → function that adds its sub-parser.  main() only builds
+# the parser of the command actually invoked; the full tree is only needed
+# for the top-level --help and for "invalid choice" errors.
+_COMMAND_PARSERS = {
+    "build-all": _add_build_all_parser,
+    "run":       _add_run_parser,
+    "assemble":  _add_assemble_parser,
+    "clean":     _add_clean_parser,
+    "cache":     _add_cache_parser,
+    "status":    _add_status_parser,
+    "info":      _add_info_parser,
+    "idea":      _add_idea_parser,
+    "git":       _add_git_parser,
+    "repo":      _add_repo_parser,
+    "project":   _add_project_parser,
+    "sdk":       _add_sdk_parser,
+}
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI parser.  If *command* names a known top-level command only
+    that sub-parser is constructed, otherwise every sub-command is added
+    (``--version`` needs none at all).
+    """
+    parser = argparse.ArgumentParser(
+        prog="build",
+        description="Islands Build Automation CLI",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--version", action="version", version="islands-build 1.0.0")
+
+    sub = parser.add_subparsers(dest="command", metavar="<command>")
+    sub.required = True
+
+    if command in _COMMAND_PARSERS:
+        _COMMAND_PARSERS[command](sub)
+    elif command == "--version":
+        pass   # the version action exits before any sub-command is needed
+    else:
+        for add_parser in _COMMAND_PARSERS.values():
+            add_parser(sub)
     return parser
 
 
@@ -1667,7 +2108,8 @@ def build_parser() -> argparse.ArgumentParser:
 # ─────────────────────────────────────────────────────────────────────────────
 
 def main() -> None:
-    parser = build_parser()
+    # Peek at the command so that only its sub-parser has to be built
+    parser = build_parser(sys.argv[1] if len(sys.argv) > 1 else None)
     args = parser.parse_args()
     sys.exit(args.func(args))
 
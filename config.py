@@ -4,8 +4,10 @@ All paths are resolved relative to the workspace root.
 Projects are discovered dynamically by scanning for project.json files –
 no hardcoded project names or artifact paths.
 """
+import functools
 import os
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 # ── Build mode ────────────────────────────────────────────────────────────────
 # Controls how pre-build hooks behave.
@@ -43,6 +45,18 @@ COFFEELOADER_RUNTIME_CONFIG = {
 _SKIP_DIRS = {BUILD_DIR.name, ".idea", ".repo", "output", ".git"}
 
 
+class ProjectSet(NamedTuple):
+    """
+    Result of a workspace scan.
+
+        ordered – project dicts in topological (dependency) order
+        rdeps   – artifactId → artifactIds of the workspace projects that
+                  directly depend on it
+    """
+    ordered: list[dict]
+    rdeps:   dict[str, set[str]]
+
+
 def scan_projects(workspace: Path = WORKSPACE) -> list[dict]:
     """
     Scan *workspace* for sub-directories that contain a ``project.json`` and
@@ -58,6 +72,14 @@ def scan_projects(workspace: Path = WORKSPACE) -> list[dict]:
     Order is determined by ``workspace_dependencies``: projects with no
     workspace deps come first; dependent projects follow.
     """
+    return scan_project_set(workspace).ordered
+
+
+def scan_project_set(workspace: Path = WORKSPACE) -> ProjectSet:
+    """
+    Like :func:`scan_projects`, but also return the reverse-dependency
+    index computed from the same manifests.
+    """
     from hooks import ProjectManifest  # lazy import to avoid circular deps
 
     # ── 1. Discover all candidate project directories ─────────────────────
@@ -125,27 +147,55 @@ def scan_projects(workspace: Path = WORKSPACE) -> list[dict]:
         _visit(aid)
 
     # ── 4. Build result list ──────────────────────────────────────────────
-    result = []
+    by_id: dict[str, dict] = {}
     for aid in ordered:
         m = manifests[aid]
-        result.append({
+        by_id[aid] = {
             "name":     m.name,
             "dir":      dirs[aid],
             "artifact": _artifact_path(m),
-        })
-    return result
+        }
+
+    # ── 5. Reverse-dependency index ───────────────────────────────────────
+    rdeps: dict[str, set[str]] = {aid: set() for aid in ordered}
+    for aid in ordered:
+        for d in manifests[aid].workspace_deps:
+            dep = d.get("artifactId", "")
+            if dep in rdeps:
+                rdeps[dep].add(aid)
 
+    return ProjectSet([by_id[aid] for aid in ordered], rdeps)
 
-# ── Lazy-evaluated project list (computed once on first access) ───────────────
-_projects_cache = None  # type: list[dict] | None
+
+# ── Lazy-evaluated project set (computed once on first access) ───────────────
+@functools.lru_cache(maxsize=1)
+def get_project_set() -> ProjectSet:
+    """
+    Return the workspace :class:`ProjectSet` (cached after first call).
+    Call :func:`invalidate_projects` after creating or editing manifests.
+    """
+    return scan_project_set()
 
 
 def get_projects() -> list[dict]:
-    """Return the workspace-scanned project list (cached after first call)."""
-    global _projects_cache
-    if _projects_cache is None:
-        _projects_cache = scan_projects()
-    return _projects_cache
+    """Return the workspace-scanned project list, in dependency order."""
+    return get_project_set().ordered
+
+
+@functools.lru_cache(maxsize=1)
+def _projects_by_folded_name() -> dict[str, dict]:
+    return {p["name"].casefold(): p for p in get_projects()}
+
+
+def find_project(name: str) -> Optional[dict]:
+    """Return the project called *name* (case-insensitive), or None."""
+    return _projects_by_folded_name().get(name.casefold())
+
+
+def invalidate_projects() -> None:
+    """Drop the cached project set so the next access rescans the workspace."""
+    get_project_set.cache_clear()
+    _projects_by_folded_name.cache_clear()
 
 
 # ── PROJECTS alias (backwards-compat for runner.py / build.py) ───────────────
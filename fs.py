@@ -6,10 +6,21 @@ import os
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import logger as log
 
+# mkstemp creates files as 0600; new files written through write_atomic
+# should get the usual umask-derived mode instead.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
@@ -51,6 +62,92 @@ def copy_artifact(src: Path, dst: Path) -> bool:
     return True
 
 
+def write_atomic(path: Path, data: Union[str, bytes]) -> None:
+    """
+    Write *data* (``str`` is encoded as UTF-8) to *path* atomically.
+
+    Same temp-file + ``os.replace`` dance as :func:`copy_artifact`: readers
+    see either the old or the new content, never a half-written file.  An
+    existing file keeps its permission bits.
+    Raises ``OSError`` on failure.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except OSError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}~")
+    try:
+        # Raw os.write on the mkstemp descriptor: the payloads are small and
+        # already encoded, so a buffered file object would only add overhead.
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_if_changed(path: Path, data: Union[str, bytes]) -> bool:
+    """
+    Atomically write *data* to *path* unless the file already holds exactly
+    these bytes.  Returns True if the file was (re)written.
+
+    Skipping identical writes keeps mtimes stable, so IDEs and file
+    watchers do not re-index files whose content did not change.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    write_atomic(path, data)
+    return True
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialise *data* as 2-space indented JSON with a trailing newline, in
+    the stdlib's ``json.dumps(data, indent=2)`` format (non-ASCII escaped as
+    ``\\uXXXX``).
+
+    ``orjson`` is used when installed, but its output is only kept when it
+    is pure ASCII, i.e. when it matches the stdlib byte for byte; anything
+    with non-ASCII text or integers beyond 64 bits goes through the stdlib.
+    The one remaining difference is the spelling of exponent floats
+    (``1e16`` vs ``1e+16``), which the manifests we write never contain.
+    """
+    if _HAS_ORJSON:
+        try:
+            out = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            out = None
+        if out is not None and out.isascii():
+            return out
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+
+
+def loads_json(data: bytes) -> Any:
+    """
+    Parse UTF-8 JSON *data* with ``orjson`` when installed, else the stdlib.
+    Malformed input raises ``json.JSONDecodeError`` either way.
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def write_json(path: Path, data: Dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, "w", encoding="utf-8") as fh:
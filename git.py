@@ -15,19 +15,23 @@ Public API
   create_branch(path, branch) → bool
   pull(path)                  → bool
   list_branches(path, remote) → list[str]
-  print_status_table(repos)   → None
-  print_branches_table(repos) → None
+  print_status_table(repos, jobs)   → None
+  print_branches_table(repos, jobs) → None
 """
 from __future__ import annotations
 
 import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import logger as log
 
+# Default number of repos queried concurrently by the table printers
+DEFAULT_JOBS = 16
+
 # ── git executable ─────────────────────────────────────────────────────────
 
 def _git() -> Optional[str]:
@@ -89,8 +93,28 @@ def status(path: Path) -> dict:
           "clean":     bool,
         }
     """
+    result = _status(path)
+    if result is None:
+        result = {
+            "branch":    current_branch(path),
+            "ahead":     0,
+            "behind":    0,
+            "staged":    0,
+            "unstaged":  0,
+            "untracked": 0,
+            "clean":     True,
+        }
+    return result
+
+
+def _status(path: Path) -> Optional[dict]:
+    """
+    Single-fork implementation of :func:`status`: the branch comes from the
+    ``# branch.*`` headers of ``git status --porcelain=v2 --branch``.
+    Returns None if *path* is not inside a git work-tree.
+    """
     result = {
-        "branch":    current_branch(path),
+        "branch":    None,
         "ahead":     0,
         "behind":    0,
         "staged":    0,
@@ -102,10 +126,15 @@ def status(path: Path) -> dict:
         # porcelain v2 gives us structured, stable output
         r = _run(["status", "--porcelain=v2", "--branch"], cwd=path)
         if r.returncode != 0:
-            return result
+            return None
 
+        head = oid = None
         for line in r.stdout.splitlines():
-            if line.startswith("# branch.ab "):
+            if line.startswith("# branch.head "):
+                head = line[len("# branch.head "):]
+            elif line.startswith("# branch.oid "):
+                oid = line[len("# branch.oid "):]
+            elif line.startswith("# branch.ab "):
                 parts = line.split()
                 # format: # branch.ab +N -N
                 for p in parts:
@@ -122,13 +151,17 @@ def status(path: Path) -> dict:
             elif line.startswith("? "):
                 result["untracked"] += 1
 
+        if head == "(detached)":
+            result["branch"] = f"(detached {oid[:7]})" if oid else None
+        else:
+            result["branch"] = head
         result["clean"] = (
             result["staged"] == 0
             and result["unstaged"] == 0
             and result["untracked"] == 0
         )
     except RuntimeError:
-        pass
+        return None
     return result
 
 
@@ -224,26 +257,30 @@ def _ahead_behind(st: dict) -> str:
     return " ".join(tokens)
 
 
-def print_status_table(repos: list[dict]) -> None:
+def _status_row(repo: dict) -> tuple[str, str, str, str]:
+    """Return the ``print_status_table`` row for a single repo."""
+    path = Path(repo["dir"])
+    name = repo["name"]
+    st = _status(path)   # one git process per repo
+    if st is None:
+        return (name, "—", "[dim]not a git repo[/dim]", "—")
+    branch = st["branch"] or "[dim]unknown[/dim]"
+    return (name, branch, _status_symbol(st), _ahead_behind(st))
+
+
+def print_status_table(repos: list[dict], *, jobs: int = DEFAULT_JOBS) -> None:
     """
     Print a rich (or plain-text) table with branch / status for every repo.
 
-    Each element of *repos* must have ``"name"`` and ``"dir"`` keys.
+    Each element of *repos* must have ``"name"`` and ``"dir"`` keys.  Up to
+    *jobs* repos are queried at once.
     """
-    rows = []
-    for repo in repos:
-        path = Path(repo["dir"])
-        name = repo["name"]
-        if not is_git_repo(path):
-            rows.append((name, "—", "[dim]not a git repo[/dim]", "—"))
-            continue
-        st = status(path)
-        branch = st["branch"] or "[dim]unknown[/dim]"
-        rows.append((name, branch, _status_symbol(st), _ahead_behind(st)))
+    # git calls are I/O bound – collect every repo concurrently, render serially
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(repos)))) as pool:
+        rows = list(pool.map(_status_row, repos))
 
     try:
         from rich.table import Table
-        from rich.console import Console
         table = Table(title="Git Status", show_lines=True)
         table.add_column("Repo",          style="bold cyan", no_wrap=True)
         table.add_column("Branch",        style="bold")
@@ -251,7 +288,7 @@ def print_status_table(repos: list[dict]) -> None:
         table.add_column("Upstream",      justify="left")
         for row in rows:
             table.add_row(*row)
-        Console().print(table)
+        log.render(table)
     except ImportError:
         print(f"\n{'Repo':<16}  {'Branch':<20}  {'Working Tree':<30}  Upstream")
         print("─" * 85)
@@ -262,39 +299,40 @@ def print_status_table(repos: list[dict]) -> None:
         print()
 
 
-def print_branches_table(repos: list[dict]) -> None:
-    """Print local branches for every repo."""
+def _branches_row(repo: dict) -> tuple[str, Optional[str], list[str]]:
+    """Return ``(name, current branch, local branches)``; branch is None outside a repo."""
+    path = Path(repo["dir"])
+    if not is_git_repo(path):
+        return (repo["name"], None, [])
+    return (repo["name"], current_branch(path) or "?", list_branches(path))
+
+
+def print_branches_table(repos: list[dict], *, jobs: int = DEFAULT_JOBS) -> None:
+    """Print local branches for every repo (up to *jobs* repos queried at once)."""
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(repos)))) as pool:
+        rows = list(pool.map(_branches_row, repos))
+
     try:
         from rich.table import Table
-        from rich.console import Console
         table = Table(title="Git Branches", show_lines=True)
         table.add_column("Repo",   style="bold cyan", no_wrap=True)
         table.add_column("Current Branch", style="bold green")
         table.add_column("All Local Branches", style="dim")
-        for repo in repos:
-            path = Path(repo["dir"])
-            name = repo["name"]
-            if not is_git_repo(path):
+        for name, cur, branches in rows:
+            if cur is None:
                 table.add_row(name, "—", "[dim]not a git repo[/dim]")
                 continue
-            cur    = current_branch(path) or "?"
-            branches = list_branches(path)
             others = [b for b in branches if b != cur]
             branch_list = ("  ".join(others)) if others else "[dim](none)[/dim]"
             table.add_row(name, cur, branch_list)
-        Console().print(table)
+        log.render(table)
     except ImportError:
-        plain = lambda s: re.sub(r"\[/?[^]]+]", "", s)
         print(f"\n{'Repo':<16}  {'Current':<20}  All Local Branches")
         print("─" * 80)
-        for repo in repos:
-            path = Path(repo["dir"])
-            name = repo["name"]
-            if not is_git_repo(path):
+        for name, cur, branches in rows:
+            if cur is None:
                 print(f"{name:<16}  {'—':<20}  not a git repo")
                 continue
-            cur = current_branch(path) or "?"
-            branches = list_branches(path)
             print(f"{name:<16}  {cur:<20}  {',  '.join(branches)}")
         print()
 
@@ -11,20 +11,31 @@ For each project a *fingerprint* is computed by hashing:
   4. The *resolved version strings* of every workspace dependency declared in
      ``workspace_dependencies``         (so changing ModularKit's version
                                          triggers a rebuild of CoffeeLoader)
-  5. The build *mode* string            (local / devel / release)
-
-The fingerprint is a single SHA-256 hex digest stored in a small JSON file
-inside  ``<workspace>/.build-cache/<artifactId>.json``.
+  5. The *cached fingerprint* of every workspace dependency
+                                        (so rebuilding ModularKit changes
+                                         CoffeeLoader's fingerprint too)
+  6. The build *mode* string            (local / devel / release)
+
+The fingerprint is a single SHA-256 hex digest, stored per artifactId in
+one SQLite database:  ``<workspace>/.build-cache/fingerprints.sqlite``
+(a single file, so marking and invalidating many projects does not create,
+rewrite and delete one small file per project).  Per-project
+``<artifactId>.json`` files left by older versions are imported into it and
+removed when the database is first created.
 
 On the next build the freshly-computed fingerprint is compared against the
 stored one.  If they match **and** the artifact (jar) still exists on disk,
 the project is skipped.  If ``--clean`` is passed the cache is ignored
-entirely and every project is rebuilt.
+entirely and every project is rebuilt; ``--no-incremental`` rebuilds every
+project as well but keeps Maven's ``target/`` directories and still records
+fresh fingerprints.
 
 Public API
 ----------
-  fingerprint(project_dir, manifest, all_manifests, mode) -> str
-      Compute the fingerprint for one project (does NOT read/write cache).
+  fingerprint(project_dir, manifest, all_manifests, mode,
+              cache_dir=None)                          -> str
+      Compute the fingerprint for one project (does NOT write the cache;
+      reads the dependencies' entries when *cache_dir* is given).
 
   is_up_to_date(project_dir, manifest, all_manifests, mode,
                 artifact_path, cache_dir)             -> bool
@@ -39,19 +50,24 @@ Public API
   invalidate(artifact_id, cache_dir)                  -> None
       Delete the cached entry for *artifact_id* so the project will rebuild.
 
-  invalidate_dependents(rebuilt_artifact_id, all_manifests, cache_dir) -> None
+  invalidate_dependents(rebuilt_artifact_id, all_manifests,
+                        cache_dir, *, dependents)     -> list[str]
       Invalidate every project whose workspace_dependencies include
       *rebuilt_artifact_id* (cascade rebuild of downstream projects).
 
   clear_cache(cache_dir)                              -> None
-      Wipe the entire cache directory (called when --clean is given).
+      Drop every stored fingerprint (called when --clean is given).  Other
+      files in *cache_dir* (build reports, the IDEA stamp) are kept.
 """
 from __future__ import annotations
 
 import hashlib
 import json
+import os
+import sqlite3
+from contextlib import closing
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Iterable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from hooks import ProjectManifest
@@ -64,37 +80,40 @@ _IGNORE_FILES = {".buildconfig-pom.xml", ".DS_Store"}
 # Internal helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _hash_file(path: Path, h: "hashlib._Hash") -> None:
+def _hash_file(path: "str | Path", h: "hashlib._Hash") -> None:
     """Feed the contents of *path* into *h* in chunks."""
     try:
         with open(path, "rb") as fh:
             for chunk in iter(lambda: fh.read(65536), b""):
                 h.update(chunk)
         # Also hash the relative file name so renames are detected
-        h.update(path.name.encode())
+        h.update(os.path.basename(path).encode())
     except OSError:
         pass
 
 
-def _hash_directory(directory: Path, h: "hashlib._Hash") -> None:
+def _hash_directory(directory: "str | Path", h: "hashlib._Hash") -> None:
     """
     Recursively hash every file under *directory*, skipping
     ``_IGNORE_DIRS`` and ``_IGNORE_FILES``.  Files are visited in
     sorted order so the hash is deterministic.
+
+    Walks with ``os.scandir`` and never descends into ignored directories,
+    instead of materialising and sorting every ``Path`` below *directory*.
+    Entries are visited in the same order ``sorted(rglob("*"))`` produced.
     """
-    if not directory.exists():
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
         return
-    for item in sorted(directory.rglob("*")):
-        if item.is_dir():
-            if item.name in _IGNORE_DIRS:
-                continue
-        elif item.is_file():
-            # Skip if any parent is in _IGNORE_DIRS
-            if any(p.name in _IGNORE_DIRS for p in item.parents):
-                continue
-            if item.name in _IGNORE_FILES:
-                continue
-            _hash_file(item, h)
+    for entry in entries:
+        if entry.is_dir():
+            if entry.name not in _IGNORE_DIRS:
+                _hash_directory(entry.path, h)
+        elif entry.is_file():
+            if entry.name not in _IGNORE_FILES:
+                _hash_file(entry.path, h)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -106,6 +125,7 @@ def fingerprint(
     manifest: "ProjectManifest",
     all_manifests: "dict[str, ProjectManifest]",
     mode: str = "local",
+    cache_dir: Optional[Path] = None,
 ) -> str:
     """
     Compute a SHA-256 fingerprint for *project_dir*.
@@ -116,10 +136,37 @@ def fingerprint(
     - ``pom.xml``
     - ``project.json``
     - Resolved version of each workspace dependency (from *all_manifests*)
+    - Cached fingerprint of each workspace dependency (when *cache_dir* is
+      given), so a rebuilt dependency makes its dependents stale
     - *mode* string
 
     Returns a 64-character hex string.
     """
+    if cache_dir is None:
+        return _fingerprint(project_dir, manifest, all_manifests, mode, None, chain=False)
+    db = _open_existing(cache_dir)
+    try:
+        return _fingerprint(project_dir, manifest, all_manifests, mode, db)
+    finally:
+        if db is not None:
+            db.close()
+
+
+def _fingerprint(
+    project_dir: Path,
+    manifest: "ProjectManifest",
+    all_manifests: "dict[str, ProjectManifest]",
+    mode: str,
+    db: Optional[sqlite3.Connection],
+    *,
+    chain: bool = True,
+) -> str:
+    """
+    :func:`fingerprint` against an already-open database *db* (None when
+    there is no database yet), so chaining the dependencies' fingerprints
+    costs one query each instead of one connection each.  ``chain=False``
+    leaves them out entirely, as ``fingerprint(cache_dir=None)`` does.
+    """
     h = hashlib.sha256()
 
     # 1. Source tree
@@ -137,6 +184,8 @@ def fingerprint(
         sibling = all_manifests.get(aid)
         dep_ver = sibling.version if sibling else dep.get("version", "unknown")
         h.update(f"dep:{dep.get('groupId','')}:{aid}:{dep_ver}".encode())
+        if chain:
+            h.update(f"dep-fp:{_load_cached(aid, db) or ''}".encode())
 
     # 4. Build mode
     h.update(f"mode:{mode}".encode())
@@ -144,28 +193,113 @@ def fingerprint(
     return h.hexdigest()
 
 
-def _cache_path(artifact_id: str, cache_dir: Path) -> Path:
-    return cache_dir / f"{artifact_id}.json"
+_DB_NAME = "fingerprints.sqlite"
+
+
+def _db_path(cache_dir: Path) -> Path:
+    return cache_dir / _DB_NAME
+
+
+def _legacy_entries(cache_dir: Path) -> list[tuple[Path, str]]:
+    """
+    The ``<artifactId>.json`` files written before the SQLite cache, as
+    ``(path, fingerprint)``.  Only files holding a ``{"fingerprint": "…"}``
+    object count; any other JSON in *cache_dir* is not ours and is ignored.
+    """
+    entries = []
+    try:
+        candidates = sorted(cache_dir.glob("*.json"))
+    except OSError:
+        return entries
+    for path in candidates:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if isinstance(data, dict) and isinstance(data.get("fingerprint"), str):
+            entries.append((path, data["fingerprint"]))
+    return entries
+
+
+def _connect(cache_dir: Path) -> sqlite3.Connection:
+    """
+    Open (creating if needed) the fingerprint database in *cache_dir*.
+
+    When the database is first created, legacy ``<artifactId>.json``
+    entries left in *cache_dir* are imported into it and then deleted.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    created = not _db_path(cache_dir).exists()
+    db = sqlite3.connect(_db_path(cache_dir))
+    # WAL + NORMAL: commits append to the log without an fsync each
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS fingerprints ("
+        " artifact_id TEXT PRIMARY KEY,"
+        " fingerprint TEXT NOT NULL)"
+    )
+    if created:
+        legacy = _legacy_entries(cache_dir)
+        if legacy:
+            with db:
+                db.executemany(
+                    "INSERT OR IGNORE INTO fingerprints (artifact_id, fingerprint) VALUES (?, ?)",
+                    [(path.stem, fp) for path, fp in legacy],
+                )
+            for path, _ in legacy:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+    return db
+
+
+def _open_existing(cache_dir: Path) -> Optional[sqlite3.Connection]:
+    """
+    :func:`_connect` for read-only callers: returns None instead of creating
+    an empty database when *cache_dir* holds no cache (new or legacy) at all.
+    """
+    if not _db_path(cache_dir).exists() and not _legacy_entries(cache_dir):
+        return None
+    try:
+        return _connect(cache_dir)
+    except sqlite3.Error:
+        return None
 
 
-def _load_cached(artifact_id: str, cache_dir: Path) -> Optional[str]:
+def _load_cached(artifact_id: str, db: Optional[sqlite3.Connection]) -> Optional[str]:
     """Return the stored fingerprint hex string, or None if absent/corrupt."""
-    p = _cache_path(artifact_id, cache_dir)
-    if not p.exists():
+    if db is None:
         return None
     try:
-        data = json.loads(p.read_text(encoding="utf-8"))
-        return data.get("fingerprint")
-    except Exception:
+        row = db.execute(
+            "SELECT fingerprint FROM fingerprints WHERE artifact_id = ?",
+            (artifact_id,),
+        ).fetchone()
+    except sqlite3.Error:
         return None
+    return row[0] if row else None
 
 
-def _save_cached(artifact_id: str, fingerprint_hex: str, cache_dir: Path) -> None:
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    _cache_path(artifact_id, cache_dir).write_text(
-        json.dumps({"fingerprint": fingerprint_hex}, indent=2) + "\n",
-        encoding="utf-8",
-    )
+def _save_cached(artifact_id: str, fingerprint_hex: str, db: sqlite3.Connection) -> None:
+    with db:
+        db.execute(
+            "INSERT OR REPLACE INTO fingerprints (artifact_id, fingerprint) VALUES (?, ?)",
+            (artifact_id, fingerprint_hex),
+        )
+
+
+def _delete_cached(artifact_ids: Iterable[str], cache_dir: Path) -> None:
+    """Drop the entries for *artifact_ids* in a single transaction."""
+    db = _open_existing(cache_dir)
+    if db is None:
+        return
+    with closing(db), db:
+        db.executemany(
+            "DELETE FROM fingerprints WHERE artifact_id = ?",
+            [(aid,) for aid in artifact_ids],
+        )
 
 
 def is_up_to_date(
@@ -187,11 +321,14 @@ def is_up_to_date(
     if not artifact_path.exists():
         return False
 
-    stored = _load_cached(manifest.artifact_id, cache_dir)
-    if stored is None:
+    db = _open_existing(cache_dir)
+    if db is None:
         return False
-
-    current = fingerprint(project_dir, manifest, all_manifests, mode)
+    with closing(db):
+        stored = _load_cached(manifest.artifact_id, db)
+        if stored is None:
+            return False
+        current = _fingerprint(project_dir, manifest, all_manifests, mode, db)
     return current == stored
 
 
@@ -206,45 +343,61 @@ def mark_built(
     Persist the current fingerprint for *manifest.artifact_id* so that the
     next call to :func:`is_up_to_date` returns True (until sources change).
     """
-    fp = fingerprint(project_dir, manifest, all_manifests, mode)
-    _save_cached(manifest.artifact_id, fp, cache_dir)
+    with closing(_connect(cache_dir)) as db:
+        fp = _fingerprint(project_dir, manifest, all_manifests, mode, db)
+        _save_cached(manifest.artifact_id, fp, db)
 
 
 def invalidate(artifact_id: str, cache_dir: Path) -> None:
     """Delete the cached fingerprint for *artifact_id*."""
-    p = _cache_path(artifact_id, cache_dir)
-    if p.exists():
-        p.unlink()
+    _delete_cached([artifact_id], cache_dir)
 
 
 def invalidate_dependents(
     rebuilt_artifact_id: str,
     all_manifests: "dict[str, ProjectManifest]",
     cache_dir: Path,
+    *,
+    dependents: Optional[set[str]] = None,
 ) -> list[str]:
     """
     After *rebuilt_artifact_id* was just built, invalidate every other
     project that lists it as a workspace dependency — so they will rebuild
     on the next pass and pick up the new library version.
 
+    Pass *dependents* (e.g. from ``cfg.get_project_set().rdeps``) to skip
+    scanning *all_manifests* for them.
+
     Returns the list of artifact IDs that were invalidated.
     """
     invalidated: list[str] = []
     for aid, m in all_manifests.items():
         if aid == rebuilt_artifact_id:
             continue
-        dep_ids = {d.get("artifactId") for d in m.workspace_deps}
-        if rebuilt_artifact_id in dep_ids:
-            invalidate(aid, cache_dir)
-            invalidated.append(aid)
+        if dependents is not None:
+            if aid not in dependents:
+                continue
+        elif rebuilt_artifact_id not in {d.get("artifactId") for d in m.workspace_deps}:
+            continue
+        invalidated.append(aid)
+    if invalidated:
+        _delete_cached(invalidated, cache_dir)
     return invalidated
 
 
 def clear_cache(cache_dir: Path) -> None:
-    """Wipe the entire cache directory (used when --clean is given)."""
-    import shutil
-    if cache_dir.exists():
-        shutil.rmtree(cache_dir)
+    """
+    Delete the fingerprint database (used when --clean is given).
+
+    Only the database and its SQLite side files go; the rest of
+    *cache_dir* (``reports/``, ``idea.stamp``) is left alone.
+    """
+    db_path = _db_path(cache_dir)
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        try:
+            os.unlink(f"{db_path}{suffix}")
+        except FileNotFoundError:
+            pass
 
 
 def scan_changed(
@@ -261,16 +414,22 @@ def scan_changed(
     Does NOT check whether the artifact jar exists — that is intentionally
     left to the caller so the watcher can distinguish "stale" from "missing".
     """
+    from hooks import ProjectManifest  # lazy
+
     stale: list[str] = []
-    for p in projects:
-        from hooks import ProjectManifest  # lazy
-        manifest = ProjectManifest.load(Path(p["dir"]))
-        if manifest is None:
-            continue
-        stored = _load_cached(manifest.artifact_id, cache_dir)
-        current = fingerprint(Path(p["dir"]), manifest, all_manifests, mode)
-        if stored != current:
-            stale.append(manifest.artifact_id)
+    db = _open_existing(cache_dir)
+    try:
+        for p in projects:
+            manifest = ProjectManifest.load(Path(p["dir"]))
+            if manifest is None:
+                continue
+            stored = _load_cached(manifest.artifact_id, db)
+            current = _fingerprint(Path(p["dir"]), manifest, all_manifests, mode, db)
+            if stored != current:
+                stale.append(manifest.artifact_id)
+    finally:
+        if db is not None:
+            db.close()
     return stale
 
 
@@ -8,6 +8,7 @@ from hooks.hooks import (
     ProjectManifest,
     PROJECT_TYPES,
     patch_pom,
+    render_patched_pom,
     universal_prebuild,
     modularkit_prebuild,
     copy_config_prebuild,
@@ -15,6 +16,7 @@ from hooks.hooks import (
     _resolve_named_hooks,
     sync_module_json,
     remove_pom_dependency,
+    render_pom_versions,
     sync_pom_versions,
     sync_root_pom,
     run_hooks,
@@ -28,6 +30,7 @@ __all__ = [
     "ProjectManifest",
     "PROJECT_TYPES",
     "patch_pom",
+    "render_patched_pom",
     "universal_prebuild",
     "modularkit_prebuild",
     "copy_config_prebuild",
@@ -35,6 +38,7 @@ __all__ = [
     "_resolve_named_hooks",
     "sync_module_json",
     "remove_pom_dependency",
+    "render_pom_versions",
     "sync_pom_versions",
     "sync_root_pom",
     "run_hooks",
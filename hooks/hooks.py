@@ -56,13 +56,13 @@ no pom override) so projects without manifests build normally.
 """
 from __future__ import annotations
 
+import copy
 import json
 import subprocess
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Optional
-from xml.dom import minidom
 
 import logger as log
 
@@ -127,6 +127,10 @@ _MANIFEST_FILE = "project.json"
 # Valid project types
 PROJECT_TYPES = ("library", "application")
 
+# project.json path → ((mtime_ns, size), manifest) – see ProjectManifest.load.
+# Callers only ever get deep copies, so unsaved edits never leak between loads.
+_manifest_cache: dict[Path, tuple[tuple[int, int], "ProjectManifest"]] = {}
+
 
 @dataclass
 class ProjectManifest:
@@ -159,10 +163,20 @@ class ProjectManifest:
         Raises ``ValueError`` on malformed JSON or missing required fields.
         """
         manifest_path = project_dir / _MANIFEST_FILE
-        if not manifest_path.exists():
+        try:
+            st = manifest_path.stat()
+        except OSError:
             return None
+
+        # Re-use the parsed manifest while the file is unchanged on disk
+        stamp  = (st.st_mtime_ns, st.st_size)
+        cached = _manifest_cache.get(manifest_path)
+        if cached is not None and cached[0] == stamp:
+            return copy.deepcopy(cached[1])
+
+        import fs as _fs
         try:
-            data = json.loads(manifest_path.read_text(encoding="utf-8"))
+            data = _fs.loads_json(manifest_path.read_bytes())
         except json.JSONDecodeError as exc:
             raise ValueError(f"Malformed {manifest_path}: {exc}") from exc
 
@@ -176,7 +190,7 @@ class ProjectManifest:
                 f"{manifest_path}: 'type' must be one of {PROJECT_TYPES}, got '{ptype}'"
             )
 
-        return cls(
+        manifest = cls(
             path         = manifest_path,
             name         = data["name"],
             group_id     = data["groupId"],
@@ -189,6 +203,8 @@ class ProjectManifest:
             artifact_name  = data.get("artifact_name", ""),
             module         = data.get("module", {}),
         )
+        _manifest_cache[manifest_path] = (stamp, copy.deepcopy(manifest))
+        return manifest
 
     @classmethod
     def load_all(cls, workspace_dir: Path, project_dirs: list[Path]) -> dict[str, "ProjectManifest"]:
@@ -210,8 +226,11 @@ class ProjectManifest:
 
     # ── persistence ────────────────────────────────────────────────────────
 
-    def save(self) -> None:
-        """Write the manifest back to its ``project.json`` file."""
+    def save(self) -> str:
+        """
+        Write the manifest back to its ``project.json`` file.
+        Returns the serialized JSON text that was written.
+        """
         data = {
             "name":        self.name,
             "groupId":     self.group_id,
@@ -226,9 +245,12 @@ class ProjectManifest:
             data["artifact_name"] = self.artifact_name
         if self.module:
             data["module"] = self.module
-        self.path.write_text(
-            json.dumps(data, indent=2) + "\n", encoding="utf-8"
-        )
+        import fs as _fs
+        payload = _fs.dumps_json(data)
+        self.path.write_bytes(payload)
+        st = self.path.stat()
+        _manifest_cache[self.path] = ((st.st_mtime_ns, st.st_size), copy.deepcopy(self))
+        return payload.decode("utf-8")
 
     # ── helpers ────────────────────────────────────────────────────────────
 
@@ -242,6 +264,25 @@ class ProjectManifest:
         """Return True if this project has a ModularKit module descriptor."""
         return bool(self.module)
 
+    def remove_deps(self, artifact_id: str, group_id: Optional[str] = None) -> list[dict]:
+        """
+        Drop every workspace dependency on *artifact_id* (restricted to
+        *group_id* when given) in a single pass.  Returns the removed entries.
+        """
+        match_group = group_id is not None   # decided once, not per dep
+        kept:    list[dict] = []
+        removed: list[dict] = []
+        for dep in self.workspace_deps:
+            if dep.get("artifactId") == artifact_id and (
+                not match_group or dep.get("groupId") == group_id
+            ):
+                removed.append(dep)
+            else:
+                kept.append(dep)
+        if removed:
+            self.workspace_deps = kept
+        return removed
+
     def effective_version(self, mode: str, commit_id: str) -> str:
         """
         Return the version string to embed in the generated pom.
@@ -273,6 +314,13 @@ def _pom_tag(local: str) -> str:
     return f"{{{_MVN_NS}}}{local}"
 
 
+# Qualified tags looked up once per <dependency>/<plugin> – built only once
+_TAG_DEPENDENCY  = _pom_tag("dependency")
+_TAG_PLUGIN      = _pom_tag("plugin")
+_TAG_GROUP_ID    = _pom_tag("groupId")
+_TAG_ARTIFACT_ID = _pom_tag("artifactId")
+
+
 def _find_or_none(element: ET.Element, *path: str) -> Optional[ET.Element]:
     """Walk a chain of tag names, return the last element or None."""
     cur = element
@@ -293,6 +341,7 @@ def _set_text(parent: ET.Element, tag: str, value: str) -> None:
 
 def _pretty_xml(root: ET.Element) -> str:
     """Return indented XML string, stripping the minidom declaration line."""
+    from xml.dom import minidom  # lazy import – only needed when a pom is rewritten
     raw  = ET.tostring(root, encoding="unicode", xml_declaration=False)
     # Re-inject the original XML declaration so the file is well-formed
     raw  = '<?xml version="1.0" encoding="UTF-8"?>\n' + raw
@@ -318,6 +367,31 @@ def patch_pom(
     """
     Read *pom_path*, apply manifest-driven patches, write to *dest*.
 
+    See :func:`render_patched_pom` for the patches applied.
+
+    Returns the path of the written file (*dest* or
+    ``pom_path.parent / ".buildconfig-pom.xml"``).
+    """
+    dest = dest or (pom_path.parent / ".buildconfig-pom.xml")
+    text = render_patched_pom(
+        pom_path, manifest, all_manifests, mode=mode, commit_id=commit_id,
+    )
+    dest.write_text(text, encoding="utf-8")
+    return dest
+
+
+def render_patched_pom(
+    pom_path: Path,
+    manifest: ProjectManifest,
+    all_manifests: dict[str, "ProjectManifest"],
+    *,
+    mode: str = "local",
+    commit_id: str = "",
+) -> str:
+    """
+    Read *pom_path*, apply manifest-driven patches and return the new pom
+    text without writing anything.
+
     Patches applied
     ---------------
     1. Project ``<groupId>``, ``<artifactId>``, ``<version>`` from manifest.
@@ -326,12 +400,7 @@ def patch_pom(
        version from *all_manifests*.
     3. If mode != "release" and ``strip_gpg_unless_release`` is True:
        remove the maven-gpg-plugin execution block.
-
-    Returns the path of the written file (*dest* or
-    ``pom_path.parent / ".buildconfig-pom.xml"``).
     """
-    dest = dest or (pom_path.parent / ".buildconfig-pom.xml")
-
     tree = ET.parse(str(pom_path))
     root = tree.getroot()
 
@@ -345,9 +414,9 @@ def patch_pom(
     # ── 2. Sync workspace dependency versions ─────────────────────────────
     deps_root = root.find(_pom_tag("dependencies"))
     if deps_root is not None:
-        for dep_el in deps_root.findall(_pom_tag("dependency")):
-            dep_group    = (dep_el.findtext(_pom_tag("groupId"))    or "").strip()
-            dep_artifact = (dep_el.findtext(_pom_tag("artifactId")) or "").strip()
+        for dep_el in deps_root.findall(_TAG_DEPENDENCY):
+            dep_group    = (dep_el.findtext(_TAG_GROUP_ID)    or "").strip()
+            dep_artifact = (dep_el.findtext(_TAG_ARTIFACT_ID) or "").strip()
             # Check against workspace_deps declared in the manifest
             for wdep in manifest.workspace_deps:
                 if (
@@ -371,14 +440,13 @@ def patch_pom(
         build_el   = root.find(_pom_tag("build"))
         plugins_el = _find_or_none(root, "build", "plugins") if build_el is not None else None
         if plugins_el is not None:
-            for plugin_el in list(plugins_el.findall(_pom_tag("plugin"))):
-                aid = (plugin_el.findtext(_pom_tag("artifactId")) or "").strip()
+            for plugin_el in list(plugins_el.findall(_TAG_PLUGIN)):
+                aid = (plugin_el.findtext(_TAG_ARTIFACT_ID) or "").strip()
                 if aid == "maven-gpg-plugin":
                     plugins_el.remove(plugin_el)
                     log.info("  stripped maven-gpg-plugin (non-release build)")
 
-    dest.write_text(_pretty_xml(root), encoding="utf-8")
-    return dest
+    return _pretty_xml(root)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -508,10 +576,8 @@ def sync_module_json(manifest: "ProjectManifest") -> bool:
     data["version"] = manifest.version    # keep version in sync
 
     try:
-        import json as _json
-        module_json_path.write_text(
-            _json.dumps(data, indent=2) + "\n", encoding="utf-8"
-        )
+        import fs as _fs
+        module_json_path.write_bytes(_fs.dumps_json(data))
         log.success(f"  module.json synced → {module_json_path}")
         return True
     except Exception as exc:
@@ -544,9 +610,9 @@ def remove_pom_dependency(
             return False
 
         removed = False
-        for dep_el in list(deps_root.findall(_pom_tag("dependency"))):
-            dep_aid = (dep_el.findtext(_pom_tag("artifactId")) or "").strip()
-            dep_gid = (dep_el.findtext(_pom_tag("groupId"))    or "").strip()
+        for dep_el in list(deps_root.findall(_TAG_DEPENDENCY)):
+            dep_aid = (dep_el.findtext(_TAG_ARTIFACT_ID) or "").strip()
+            dep_gid = (dep_el.findtext(_TAG_GROUP_ID)    or "").strip()
             if dep_aid == artifact_id and (group_id is None or dep_gid == group_id):
                 deps_root.remove(dep_el)
                 removed = True
@@ -560,22 +626,19 @@ def remove_pom_dependency(
         return False
 
 
-def sync_pom_versions(
+def render_pom_versions(
     project_dir: Path,
     all_manifests: dict[str, "ProjectManifest"],
     *,
     mode: str = "local",
     commit_id: str = "",
-) -> bool:
+) -> Optional[tuple[Path, str]]:
     """
-    Patch ``pom.xml`` **in-place** (overwriting the real file, not a build
-    override) so that version numbers stay consistent with ``project.json``.
-
-    Unlike :func:`patch_pom`, this writes directly to ``pom.xml`` so the
-    canonical source of truth is always up-to-date after manifest edits.
+    Compute the in-place ``pom.xml`` update for *project_dir* without
+    writing it, so callers can batch several edits before committing them.
 
-    Returns ``True`` on success, ``False`` if the pom is missing or an error
-    occurs.
+    Returns ``(pom_path, new_text)``, or ``None`` if the pom is missing or an
+    error occurs.
     """
     manifest = all_manifests.get(
         next(
@@ -590,23 +653,53 @@ def sync_pom_versions(
         except ValueError:
             manifest = None
     if manifest is None:
-        return False
+        return None
 
     pom_path = project_dir / "pom.xml"
     if not pom_path.exists():
-        return False
+        return None
 
     try:
-        patch_pom(
+        text = render_patched_pom(
             pom_path,
             manifest,
             all_manifests,
             mode=mode,
             commit_id=commit_id,
-            dest=pom_path,          # overwrite the real pom.xml
         )
-        return True
     except Exception as exc:
+        log.error(f"sync_pom_versions failed for {project_dir.name}: {exc}")
+        return None
+    return pom_path, text
+
+
+def sync_pom_versions(
+    project_dir: Path,
+    all_manifests: dict[str, "ProjectManifest"],
+    *,
+    mode: str = "local",
+    commit_id: str = "",
+) -> bool:
+    """
+    Patch ``pom.xml`` **in-place** (overwriting the real file, not a build
+    override) so that version numbers stay consistent with ``project.json``.
+
+    Unlike :func:`patch_pom`, this writes directly to ``pom.xml`` so the
+    canonical source of truth is always up-to-date after manifest edits.
+    The file is replaced atomically.
+
+    Returns ``True`` on success, ``False`` if the pom is missing or an error
+    occurs.
+    """
+    import fs as _fs
+
+    edit = render_pom_versions(project_dir, all_manifests, mode=mode, commit_id=commit_id)
+    if edit is None:
+        return False
+    try:
+        _fs.write_atomic(*edit)
+        return True
+    except OSError as exc:
         log.error(f"sync_pom_versions failed for {project_dir.name}: {exc}")
         return False
 
@@ -2,7 +2,10 @@
 Logging helpers: coloured, timestamped output with rich-style sections.
 Falls back to plain text if 'rich' is not installed.
 """
+import contextlib
+import io
 import sys
+import threading
 import time
 from datetime import datetime
 
@@ -33,7 +36,22 @@ def _ts() -> str:
     return datetime.now().strftime("%H:%M:%S")
 
 
+# Per-thread list of deferred log calls – see deferred()
+_local = threading.local()
+
+
+def _defer(fn, *args) -> bool:
+    """Record ``fn(*args)`` instead of printing if this thread is deferring."""
+    records = getattr(_local, "records", None)
+    if records is None:
+        return False
+    records.append((fn, args))
+    return True
+
+
 def section(title: str) -> None:
+    if _defer(section, title):
+        return
     if _HAS_RICH:
         _console.rule(f"[bold cyan]{title}[/bold cyan]")
     else:
@@ -42,6 +60,8 @@ def section(title: str) -> None:
 
 
 def info(msg: str) -> None:
+    if _defer(info, msg):
+        return
     if _HAS_RICH:
         _console.print(f"[dim]{_ts()}[/dim]  [blue]ℹ[/blue]  {msg}")
     else:
@@ -49,6 +69,8 @@ def info(msg: str) -> None:
 
 
 def success(msg: str) -> None:
+    if _defer(success, msg):
+        return
     if _HAS_RICH:
         _console.print(f"[dim]{_ts()}[/dim]  [bold green]✔[/bold green]  {msg}")
     else:
@@ -56,6 +78,8 @@ def success(msg: str) -> None:
 
 
 def warn(msg: str) -> None:
+    if _defer(warn, msg):
+        return
     if _HAS_RICH:
         _console.print(f"[dim]{_ts()}[/dim]  [bold yellow]⚠[/bold yellow]  {msg}")
     else:
@@ -63,6 +87,8 @@ def warn(msg: str) -> None:
 
 
 def error(msg: str) -> None:
+    if _defer(error, msg):
+        return
     if _HAS_RICH:
         _console_err.print(f"[dim]{_ts()}[/dim]  [bold red]✖[/bold red]  {msg}")
     else:
@@ -70,6 +96,8 @@ def error(msg: str) -> None:
 
 
 def step(index: int, total: int, msg: str) -> None:
+    if _defer(step, index, total, msg):
+        return
     label = f"[{index}/{total}]"
     if _HAS_RICH:
         _console.print(f"[dim]{_ts()}[/dim]  [bold magenta]{label}[/bold magenta]  {msg}")
@@ -78,6 +106,8 @@ def step(index: int, total: int, msg: str) -> None:
 
 
 def banner(title: str, subtitle: str = "") -> None:
+    if _defer(banner, title, subtitle):
+        return
     if _HAS_RICH:
         text = Text(title, style="bold cyan")
         if subtitle:
@@ -91,6 +121,85 @@ def banner(title: str, subtitle: str = "") -> None:
         print(f"{'═' * 60}{_RESET}\n")
 
 
+def render(renderable) -> None:
+    """
+    Print a rich renderable (table, markup string, …) on the shared console,
+    so callers need not build their own ``Console``.  Requires rich.
+    """
+    if _defer(render, renderable):
+        return
+    _console.print(renderable)
+
+
+def raw(text: str) -> None:
+    """Write *text* (e.g. captured tool output) to stdout verbatim."""
+    if _defer(raw, text):
+        return
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def newline() -> None:
+    """Print an empty line (goes through the console, so it is buffered too)."""
+    if _defer(newline):
+        return
+    if _HAS_RICH:
+        _console.print()
+    else:
+        print()
+
+
+@contextlib.contextmanager
+def buffered():
+    """
+    Collect everything written to stdout inside the block and emit it with a
+    single write when the block exits, e.g. for multi-line reports::
+
+        with log.buffered():
+            log.info("…")
+            log.info("…")
+
+    Errors still go straight to stderr.
+    """
+    if _HAS_RICH:
+        with _console:   # rich renders its record buffer once, on exit
+            yield
+        return
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+
+@contextlib.contextmanager
+def deferred():
+    """
+    Record every log call made by the current thread inside the block
+    instead of printing it, and yield the list of records.  Worker threads
+    use this so their output can be printed later, in one piece, by the main
+    thread via :func:`replay` – other threads keep logging normally.
+    """
+    _local.records = records = []
+    try:
+        yield records
+    finally:
+        _local.records = None
+
+
+def is_deferred() -> bool:
+    """True inside a :func:`deferred` block on the current thread."""
+    return getattr(_local, "records", None) is not None
+
+
+def replay(records: list) -> None:
+    """Print log calls recorded by :func:`deferred`, in order."""
+    for fn, args in records:
+        fn(*args)
+
+
 def duration(seconds: float) -> str:
     if seconds < 60:
         return f"{seconds:.1f}s"
@@ -1,5 +1,9 @@
 """
 Maven build helpers.
+
+The Maven Daemon (``mvnd``) is preferred over ``mvn`` when it is installed:
+it keeps warm JVMs around, so consecutive project builds skip the JVM
+start-up.  Set ``ISLANDS_MAVEN_BIN`` to force a specific executable.
 """
 import os
 import shutil
@@ -11,6 +15,23 @@ from typing import Dict, List, Optional
 import logger as log
 
 
+def _maven_binary(path: str, *, use_mvnd: bool = True) -> Optional[str]:
+    """
+    Resolve the Maven executable on *path*.
+
+    ``ISLANDS_MAVEN_BIN`` (a name or an absolute path) wins; otherwise
+    ``mvnd`` is used if present and *use_mvnd* is set, then ``mvn``.
+    """
+    override = os.environ.get("ISLANDS_MAVEN_BIN")
+    if override:
+        return shutil.which(override, path=path) or override
+    if use_mvnd:
+        mvnd = shutil.which("mvnd", path=path)
+        if mvnd:
+            return mvnd
+    return shutil.which("mvn", path=path)
+
+
 def run_maven(
     project_dir: Path,
     goals: List[str],
@@ -20,11 +41,15 @@ def run_maven(
     verbose: bool = False,
     env: Optional[Dict[str, str]] = None,
     pom_override: Optional[Path] = None,
+    use_mvnd: bool = True,
+    threads: Optional[str] = None,
 ) -> bool:
     """
     Run 'mvn <goals>' inside *project_dir*, streaming all output live.
     Pass *env* to override environment variables (e.g. JAVA_HOME).
     Pass *pom_override* to use a different pom file (e.g. .buildconfig-pom.xml).
+    Pass ``use_mvnd=False`` to never pick the Maven Daemon.
+    Pass *threads* (e.g. ``"4"`` or ``"1C"``) to build modules in parallel (``-T``).
 
     Returns True on success, False on failure.
     """
@@ -33,32 +58,46 @@ def run_maven(
         cmd += ["-f", str(pom_override)]
     if skip_tests:
         cmd += ["-DskipTests"]
+    if threads:
+        cmd += ["-T", threads]
     if extra_args:
         cmd += extra_args
     if not verbose:
         # batch-mode removes download progress spam; output still streams live
         cmd += ["--batch-mode"]
 
-    # Resolve mvn from the provided env's PATH so the right JDK is used
+    # Resolve mvn/mvnd from the provided env's PATH so the right JDK is used
     effective_env = env if env is not None else os.environ.copy()
-    mvn_bin = shutil.which("mvn", path=effective_env.get("PATH", os.environ.get("PATH", "")))
+    mvn_bin = _maven_binary(
+        effective_env.get("PATH", os.environ.get("PATH", "")), use_mvnd=use_mvnd,
+    )
     if mvn_bin:
         cmd[0] = mvn_bin
 
     java_home = (env or {}).get("JAVA_HOME", "")
     java_tag = f"  [JAVA_HOME={java_home}]" if java_home else ""
     log.info(f"Running: {' '.join(cmd)}  (in {project_dir.name}){java_tag}")
-    start = time.time()
+    start = time.perf_counter()
 
     try:
-        # stdout/stderr are NOT captured — they go straight to the terminal
+        # stdout/stderr are NOT captured — they go straight to the terminal,
+        # unless this thread's log is deferred (parallel build-all): then the
+        # output is captured and replayed together with the project's log.
         # env=None means inherit the current process env (ambient PATH/JAVA_HOME)
-        result = subprocess.run(cmd, cwd=project_dir, env=env if env is not None else os.environ.copy())
+        if log.is_deferred():
+            result = subprocess.run(
+                cmd, cwd=project_dir, env=env if env is not None else os.environ.copy(),
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                text=True, errors="replace",
+            )
+            log.raw(result.stdout)
+        else:
+            result = subprocess.run(cmd, cwd=project_dir, env=env if env is not None else os.environ.copy())
     except FileNotFoundError:
-        log.error("'mvn' not found – please install Apache Maven and add it to PATH.")
+        log.error(f"'{cmd[0]}' not found – please install Apache Maven and add it to PATH.")
         return False
 
-    elapsed = time.time() - start
+    elapsed = time.perf_counter() - start
 
     if result.returncode != 0:
         log.error(
@@ -82,6 +121,8 @@ def build_project(
     env: Optional[Dict[str, str]] = None,
     pom_override: Optional[Path] = None,
     extra_maven_args: Optional[List[str]] = None,
+    use_mvnd: bool = True,
+    threads: Optional[str] = None,
 ) -> bool:
     """Build a single Maven project and report the result."""
     log.section(f"Building  {name}")
@@ -100,6 +141,8 @@ def build_project(
         env=env,
         pom_override=pom_override,
         extra_args=all_extra if all_extra else None,
+        use_mvnd=use_mvnd,
+        threads=threads,
     )
     if ok:
         log.success(f"{name} — build OK")
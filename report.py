@@ -0,0 +1,100 @@
+"""
+Build reports: per-step timings for build-all / run.
+
+A :class:`BuildReport` records how long each step of a build took and how
+it ended, then writes a small Markdown summary to
+``<cache_dir>/reports/<command>-<timestamp>.md`` so slow steps and
+regressions can be compared across runs after the terminal output is gone.
+Only the newest ``_KEEP`` reports are kept.
+
+Typical use::
+
+    report = BuildReport("build-all")
+    with report.step("ModularKit") as row:
+        ok = build(...)
+        row["status"] = "built" if ok else "failed"
+    report.skipped("CoffeeLoader")
+    report.write(cache_dir, ok=True)
+"""
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+import fs
+
+_KEEP = 20   # reports kept per cache dir; older ones are pruned on write
+
+
+class BuildReport:
+    """Collects ``(step, status, seconds)`` rows; safe to use from worker threads."""
+
+    def __init__(self, command: str) -> None:
+        self.command  = command
+        self.started  = datetime.now()
+        self._t0      = time.perf_counter()
+        self._rows: list[dict] = []
+        self._lock    = threading.Lock()
+
+    @contextlib.contextmanager
+    def step(self, name: str) -> Iterator[dict]:
+        """
+        Time the body of the ``with`` block as step *name*.
+
+        The yielded row's ``status`` defaults to ``"ok"``; set it to record a
+        different outcome.  An exception escaping the block records ``"error"``.
+        """
+        row   = {"step": name, "status": "ok"}
+        start = time.perf_counter()
+        try:
+            yield row
+        except BaseException:
+            row["status"] = "error"
+            raise
+        finally:
+            row["seconds"] = time.perf_counter() - start
+            with self._lock:
+                self._rows.append(row)
+
+    def skipped(self, name: str, status: str = "up-to-date") -> None:
+        """Record a step that did no work."""
+        with self._lock:
+            self._rows.append({"step": name, "status": status, "seconds": 0.0})
+
+    def render(self, *, ok: bool) -> str:
+        """Return the report as Markdown."""
+        total = time.perf_counter() - self._t0
+        lines = [
+            f"# {self.command} — {self.started:%Y-%m-%d %H:%M:%S}",
+            "",
+            f"Result: {'success' if ok else 'FAILED'}  |  Total: {total:.2f} s",
+            "",
+            "| Step | Status | Seconds |",
+            "|------|--------|--------:|",
+        ]
+        with self._lock:
+            rows = list(self._rows)
+        lines += [f"| {r['step']} | {r['status']} | {r['seconds']:.2f} |" for r in rows]
+        return "\n".join(lines) + "\n"
+
+    def write(self, cache_dir: Path, *, ok: bool) -> Path:
+        """
+        Write the report under ``<cache_dir>/reports/`` and prune old ones.
+        Returns the path of the new report.
+        """
+        reports = cache_dir / "reports"
+        reports.mkdir(parents=True, exist_ok=True)
+        path = reports / f"{self.command}-{self.started:%Y%m%d-%H%M%S-%f}.md"
+        fs.write_atomic(path, self.render(ok=ok))
+
+        # Timestamped names sort chronologically
+        for old in sorted(reports.glob(f"{self.command}-*.md"))[:-_KEEP]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+        return path
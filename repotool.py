@@ -267,13 +267,26 @@ def repo_info(workspace: Path) -> str:
         return ""
 
 
-def forall(workspace: Path, command: str, *, verbose: bool = False) -> bool:
+def forall(
+    workspace: Path,
+    command: str,
+    *,
+    jobs: int = 1,
+    verbose: bool = False,
+) -> bool:
     """
     Run ``repo forall -c <command>`` across all projects.
     Streams output to the terminal regardless of *verbose*.
+
+    With *jobs* > 1 the command runs in that many projects at once
+    (``repo forall -j``); repo keeps each project's output together.
     """
+    args = ["forall"]
+    if jobs > 1:
+        args.append(f"-j{jobs}")
+    args += ["-c", command]
     try:
-        r = _run(["forall", "-c", command], cwd=workspace, capture=False)
+        r = _run(args, cwd=workspace, capture=False)
         return r.returncode == 0
     except RuntimeError as exc:
         log.error(str(exc))
@@ -371,7 +384,6 @@ def print_manifest_table(workspace: Path) -> None:
 
     try:
         from rich.table import Table
-        from rich.console import Console
         table = Table(title="Manifest Projects", show_lines=True)
         table.add_column("Path",     style="bold cyan",  no_wrap=True)
         table.add_column("Name",     style="dim")
@@ -385,8 +397,8 @@ def print_manifest_table(workspace: Path) -> None:
                 else f"[magenta]{rev}[/magenta]"
             )
             table.add_row(p["path"], p["name"], rev_str, p["remote"])
-        Console().print(table)
-        Console().print(
+        log.render(table)
+        log.render(
             f"[dim]Default revision:[/dim] [bold]{default_rev}[/bold]  "
             f"[dim]Default remote:[/dim] [bold]{m.default_remote()}[/bold]  "
             f"[dim]Manifest:[/dim] {m.path}"
@@ -5,8 +5,9 @@ High-level run configurations:
 """
 import signal
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import config as cfg
 import fs
@@ -14,6 +15,7 @@ import hasher as hashermod
 import hooks as hooksmod
 import logger as log
 import maven
+import report as reportmod
 import sdkman
 
 
@@ -114,61 +116,75 @@ def _assemble_output(*, clean: bool = False) -> bool:
     The first application project that is NOT a module is treated as the launcher.
     """
     log.section("Assembling output directory")
+    _prepare_output(clean=clean)
 
+    for project in cfg.get_projects():
+        if not _assemble_project(project):
+            return False
+
+    log.info(f"Module source: {cfg.MODULES_DIR}")
+    return True
+
+
+def _prepare_output(*, clean: bool) -> None:
+    """Wipe (*clean*) or create the output directory before artifacts are copied in."""
     if clean:
         fs.clean_output(cfg.OUTPUT_DIR)
     else:
         fs.ensure_dir(cfg.OUTPUT_DIR)
         fs.ensure_dir(cfg.MODULES_DIR)
 
-    projects = cfg.get_projects()
-    launcher_jar: Optional[Path] = None
-
-    for project in projects:
-        art = project.get("artifact")
-        if not art:
-            continue
-        art = Path(art)
-
-        # Load manifest to check module block and project type
-        m = None
-        try:
-            from hooks import ProjectManifest
-            m = ProjectManifest.load(Path(project["dir"]))
-        except Exception:
-            pass
-
-        if m and m.is_module():
-            # ModularKit module → output/modules/
-            dest = cfg.MODULES_DIR / art.name
-            ok = fs.copy_artifact(art, dest)
-            if not ok:
-                return False
-        else:
-            # Launcher or library → output/
-            dest = cfg.OUTPUT_DIR / art.name
-            ok = fs.copy_artifact(art, dest)
-            if not ok:
-                return False
-            if m and m.is_application() and launcher_jar is None:
-                launcher_jar = dest
-
-        # Run any copy_config hooks declared in this project's manifest so
-        # output/config.json is always present even on --fast-build / assemble.
-        if m is not None:
-            named = hooksmod._resolve_named_hooks(m, "pre_build")
-            for hook_fn in named:
-                if hook_fn is hooksmod.copy_config_prebuild:
-                    ctx = hooksmod.build_hook_context(project, workspace_dir=cfg.WORKSPACE)
-                    result = hook_fn(ctx)
-                    if not result.success:
-                        log.error(f"copy_config hook failed for {project['name']}: {result.message}")
-                        return False
 
-    log.info(f"Module source: {cfg.MODULES_DIR}")
+def _assemble_project(project: dict) -> bool:
+    """
+    Copy one project's artifact into the output directory (routing as in
+    :func:`_assemble_output`) and run its copy_config hooks.
+    """
+    art = project.get("artifact")
+    if not art:
+        return True
+    art = Path(art)
+
+    # Load manifest to check module block and project type
+    m = None
+    try:
+        m = hooksmod.ProjectManifest.load(Path(project["dir"]))
+    except Exception:
+        pass
+
+    if m and m.is_module():
+        # ModularKit module → output/modules/
+        dest = cfg.MODULES_DIR / art.name
+    else:
+        # Launcher or library → output/
+        dest = cfg.OUTPUT_DIR / art.name
+    if not fs.copy_artifact(art, dest):
+        return False
+
+    # Run any copy_config hooks declared in this project's manifest so
+    # output/config.json is always present even on --fast-build / assemble.
+    if m is not None:
+        named = hooksmod._resolve_named_hooks(m, "pre_build")
+        for hook_fn in named:
+            if hook_fn is hooksmod.copy_config_prebuild:
+                ctx = hooksmod.build_hook_context(project, workspace_dir=cfg.WORKSPACE)
+                result = hook_fn(ctx)
+                if not result.success:
+                    log.error(f"copy_config hook failed for {project['name']}: {result.message}")
+                    return False
     return True
 
 
+def _assemble_project_deferred(project: dict) -> Tuple[bool, list]:
+    """
+    :func:`_assemble_project` for worker threads: returns its result together
+    with its recorded log calls, for the caller to :func:`logger.replay`.
+    """
+    with log.deferred() as records:
+        ok = _assemble_project(project)
+    return ok, records
+
+
 def build_and_run_islands(
     *,
     skip_tests: bool = True,
@@ -189,6 +205,11 @@ def build_and_run_islands(
       4. Assemble output directory
       5. Launch CoffeeLoader (blocking – Ctrl+C to stop)
 
+    Step 4 overlaps the builds: once the first project has been built, each
+    artifact is copied into the output directory as soon as its project is
+    built or found up-to-date.  A failed copy stops the pipeline before the
+    next build.
+
     Pass fast_build=True to skip the Maven build steps (1-3) entirely.
     Pass clean=True to force rebuild of everything (ignores hash cache).
     """
@@ -204,89 +225,160 @@ def build_and_run_islands(
     if env is None and cfg.JAVA_VERSION:
         return False
 
-    if fast_build:
-        log.info("--fast-build: skipping Maven build, using existing artifacts.")
-    else:
-        # --clean wipes hash cache so everything rebuilds
-        if clean:
-            hashermod.clear_cache(effective_cache)
-            log.info("--clean: build cache cleared, all projects will rebuild.")
-
-        # Build manifest map once for fingerprinting
-        all_manifests: dict = {}
-        for p in projects:
-            m = hooksmod.ProjectManifest.load(Path(p["dir"]))
-            if m is not None:
-                all_manifests[m.artifact_id] = m
-
-        total = len(projects)
-        for i, project in enumerate(projects, 1):
-            log.step(i, total, project["name"])
-
-            manifest = hooksmod.ProjectManifest.load(Path(project["dir"]))
-            artifact  = Path(project["artifact"]) if project.get("artifact") else None
-
-            # ── hash-diff check ──────────────────────────────────────────
-            if (
-                not clean
-                and manifest is not None
-                and artifact is not None
-                and hashermod.is_up_to_date(
-                    Path(project["dir"]), manifest, all_manifests,
-                    effective_mode, artifact, effective_cache,
-                )
-            ):
-                log.info(f"[{project['name']}] ✓ up-to-date — skipping")
-                continue
-
-            # ── pre-build hooks ──────────────────────────────────────────
-            ctx = hooksmod.build_hook_context(project, mode=effective_mode,
-                                              verbose=verbose, workspace_dir=cfg.WORKSPACE)
-            ok, pom_override, extra_mvn_args = hooksmod.run_hooks(
-                "pre_build",
-                [hooksmod.universal_prebuild],
-                ctx,
-            )
+    # Per-step timings, written to .build-cache/reports/ before the launch
+    report = reportmod.BuildReport("run")
+
+    # Artifacts are copied into output/ on a background thread while later
+    # projects are still building; one worker keeps the copies (and their
+    # copy_config hooks) in project order.  The worker's log lines are
+    # recorded and printed from here, between builds.
+    copier = ThreadPoolExecutor(max_workers=1)
+    copies:  list = []         # futures of _assemble_project_deferred, in order
+    pending: list = []         # projects waiting for output/ to be prepared
+    prepared = False
+    assembling_shown = False
+
+    def _start_copies() -> None:
+        # output/ is prepared (and wiped with --clean) only once a build has
+        # succeeded – or at the very end – so a failing first build leaves
+        # the previous output in place.
+        nonlocal prepared
+        if not prepared:
+            _prepare_output(clean=clean_output)
+            prepared = True
+        copies.extend(copier.submit(_assemble_project_deferred, p) for p in pending)
+        pending.clear()
+
+    def _drain(*, wait: bool) -> bool:
+        # Print the logs of finished copies; False as soon as one has failed.
+        nonlocal assembling_shown
+        while copies and (wait or copies[0].done()):
+            ok, records = copies.pop(0).result()
+            if not assembling_shown:
+                log.section("Assembling output directory")
+                assembling_shown = True
+            log.replay(records)
             if not ok:
-                log.error(f"Pre-build hook failed for: {project['name']}")
                 return False
+        return True
 
-            # ── maven build ──────────────────────────────────────────────
-            ok = maven.build_project(
-                project["name"],
-                project["dir"],
-                skip_tests=skip_tests,
-                clean=clean,
-                verbose=verbose,
-                env=env,
-                pom_override=pom_override,
-                extra_maven_args=extra_mvn_args,
-            )
-            if not ok:
-                log.error(f"Build pipeline aborted at: {project['name']}")
-                return False
-
-            # ── post-build hooks ─────────────────────────────────────────
-            ok, _, _ = hooksmod.run_hooks("post_build", [], ctx)
-            if not ok:
-                log.error(f"Post-build hook failed for: {project['name']}")
-                return False
+    def _abort() -> bool:
+        report.write(effective_cache, ok=False)
+        return False
 
-            # ── update cache & cascade-invalidate dependents ─────────────
-            if manifest is not None:
-                hashermod.mark_built(
-                    Path(project["dir"]), manifest, all_manifests,
-                    effective_mode, effective_cache,
-                )
-                invalidated = hashermod.invalidate_dependents(
-                    manifest.artifact_id, all_manifests, effective_cache
+    try:
+        if fast_build:
+            log.info("--fast-build: skipping Maven build, using existing artifacts.")
+        else:
+            # --clean wipes hash cache so everything rebuilds
+            if clean:
+                hashermod.clear_cache(effective_cache)
+                log.info("--clean: build cache cleared, all projects will rebuild.")
+
+            # Build manifest map once for fingerprinting
+            all_manifests: dict = {}
+            manifests:     list = []
+            for p in projects:
+                m = hooksmod.ProjectManifest.load(Path(p["dir"]))
+                manifests.append(m)
+                if m is not None:
+                    all_manifests[m.artifact_id] = m
+
+            total = len(projects)
+            for i, (project, manifest) in enumerate(zip(projects, manifests), 1):
+                log.step(i, total, project["name"])
+
+                artifact  = Path(project["artifact"]) if project.get("artifact") else None
+
+                # ── hash-diff check ──────────────────────────────────────
+                if (
+                    not clean
+                    and manifest is not None
+                    and artifact is not None
+                    and hashermod.is_up_to_date(
+                        Path(project["dir"]), manifest, all_manifests,
+                        effective_mode, artifact, effective_cache,
+                    )
+                ):
+                    log.info(f"[{project['name']}] ✓ up-to-date — skipping")
+                    report.skipped(project["name"])
+                    pending.append(project)
+                    if prepared:
+                        _start_copies()
+                    if not _drain(wait=False):
+                        log.error("Failed to assemble output directory.")
+                        return _abort()
+                    continue
+
+                # ── pre-build hooks ──────────────────────────────────────
+                ctx = hooksmod.build_hook_context(project, mode=effective_mode,
+                                                  verbose=verbose, workspace_dir=cfg.WORKSPACE)
+                ok, pom_override, extra_mvn_args = hooksmod.run_hooks(
+                    "pre_build",
+                    [hooksmod.universal_prebuild],
+                    ctx,
                 )
-                if invalidated:
-                    log.info(f"  cache invalidated for: {', '.join(invalidated)}")
-
-    if not _assemble_output(clean=clean_output):
-        log.error("Failed to assemble output directory.")
-        return False
+                if not ok:
+                    log.error(f"Pre-build hook failed for: {project['name']}")
+                    return _abort()
+
+                # ── maven build ──────────────────────────────────────────
+                with report.step(project["name"]) as row:
+                    ok = maven.build_project(
+                        project["name"],
+                        project["dir"],
+                        skip_tests=skip_tests,
+                        clean=clean,
+                        verbose=verbose,
+                        env=env,
+                        pom_override=pom_override,
+                        extra_maven_args=extra_mvn_args,
+                    )
+                    row["status"] = "built" if ok else "failed"
+                if not ok:
+                    log.error(f"Build pipeline aborted at: {project['name']}")
+                    return _abort()
+
+                # ── post-build hooks ─────────────────────────────────────
+                ok, _, _ = hooksmod.run_hooks("post_build", [], ctx)
+                if not ok:
+                    log.error(f"Post-build hook failed for: {project['name']}")
+                    return _abort()
+
+                # ── update cache & cascade-invalidate dependents ─────────
+                if manifest is not None:
+                    hashermod.mark_built(
+                        Path(project["dir"]), manifest, all_manifests,
+                        effective_mode, effective_cache,
+                    )
+                    invalidated = hashermod.invalidate_dependents(
+                        manifest.artifact_id, all_manifests, effective_cache
+                    )
+                    if invalidated:
+                        log.info(f"  cache invalidated for: {', '.join(invalidated)}")
+
+                pending.append(project)
+                _start_copies()
+                if not _drain(wait=False):
+                    log.error("Failed to assemble output directory.")
+                    return _abort()
+
+        # Only the copies still outstanding after the last build are timed here
+        with report.step("assemble") as row:
+            if fast_build:
+                ok = _assemble_output(clean=clean_output)
+            else:
+                _start_copies()
+                ok = _drain(wait=True)
+                if ok:
+                    log.info(f"Module source: {cfg.MODULES_DIR}")
+            row["status"] = "ok" if ok else "failed"
+        if not ok:
+            log.error("Failed to assemble output directory.")
+            return _abort()
+    finally:
+        copier.shutdown(cancel_futures=True)
+    log.info(f"Report: {report.write(effective_cache, ok=True)}")
 
     return _launch_coffeeloader(java_opts=java_opts, env=env)
 
@@ -300,9 +392,8 @@ def _find_launcher_jar() -> Optional[Path]:
         return None
     # Prefer jars that match an application artifact name
     try:
-        from hooks import ProjectManifest
         for project in cfg.get_projects():
-            m = ProjectManifest.load(Path(project["dir"]))
+            m = hooksmod.ProjectManifest.load(Path(project["dir"]))
             if m and m.project_type == "application":
                 candidate = cfg.OUTPUT_DIR / Path(project["artifact"]).name
                 if candidate.exists():
@@ -7,7 +7,11 @@ Allows the build system to:
   - Resolve JAVA_HOME for a specific candidate identifier
   - Install a Java candidate via sdkman
   - Build an env dict (JAVA_HOME + PATH) suitable for subprocess calls
+
+Lookups are memoised for the lifetime of the process; anything that changes
+the installed candidates must call :func:`invalidate`.
 """
+import functools
 import os
 import shutil
 import subprocess
@@ -22,11 +26,13 @@ SDKMAN_INIT = SDKMAN_DIR / "bin" / "sdkman-init.sh"
 JAVA_CANDIDATES_DIR = SDKMAN_DIR / "candidates" / "java"
 
 
+@functools.lru_cache(maxsize=1)
 def is_available() -> bool:
     """Return True if sdkman is installed on this machine."""
     return SDKMAN_INIT.exists()
 
 
+@functools.lru_cache(maxsize=1)
 def installed_candidates() -> List[Tuple[str, Path]]:
     """
     Return a list of (identifier, java_home) for every locally-installed
@@ -43,6 +49,7 @@ def installed_candidates() -> List[Tuple[str, Path]]:
     return result
 
 
+@functools.lru_cache(maxsize=1)
 def current_candidate() -> Optional[Tuple[str, Path]]:
     """Return (identifier, java_home) for the currently active candidate, or None."""
     current = JAVA_CANDIDATES_DIR / "current"
@@ -54,6 +61,15 @@ def current_candidate() -> Optional[Tuple[str, Path]]:
     return identifier, resolved
 
 
+def invalidate() -> None:
+    """Forget the memoised sdkman lookups (call after installing/switching)."""
+    is_available.cache_clear()
+    installed_candidates.cache_clear()
+    current_candidate.cache_clear()
+    resolve_java_home.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
 def resolve_java_home(identifier: str) -> Optional[Path]:
     """
     Given a candidate identifier (e.g. '24.0.2-tem' or '21.0.6-tem'),
@@ -102,6 +118,7 @@ def _run_sdk_cmd(args: List[str]) -> bool:
         ["bash", "-c", cmd_str],
         env={**os.environ, "SDKMAN_AUTO_ANSWER": "true"},
     )
+    invalidate()   # the command may have added or switched candidates
     return result.returncode == 0
 
 
@@ -162,7 +179,6 @@ def print_candidates() -> None:
 
     try:
         from rich.table import Table
-        from rich.console import Console
         table = Table(title="Installed Java Candidates (sdkman)", show_lines=False)
         table.add_column("Identifier",  style="cyan",  no_wrap=True)
         table.add_column("Status",      justify="center")
@@ -170,7 +186,7 @@ def print_candidates() -> None:
         for name, home in candidates:
             status = "[bold green]current[/bold green]" if name == current_name else ""
             table.add_row(name, status, str(home))
-        Console().print(table)
+        log.render(table)
     except ImportError:
         print(f"\n{'Identifier':<22}  {'Status':<10}  JAVA_HOME")
         print("─" * 80)
@@ -39,6 +39,7 @@ Public API
 from __future__ import annotations
 
 import json
+import os
 import signal
 import subprocess
 import threading
@@ -276,7 +277,7 @@ class _WatcherBridge:
         """Obtain / refresh a JWT token. Returns False if no API key is set."""
         if not self._api_key:
             return False
-        if self._token and (time.time() - self._token_ts) < self._TOKEN_TTL:
+        if self._token and (time.monotonic() - self._token_ts) < self._TOKEN_TTL:
             return True
         try:
             body = json.dumps({"apiKey": self._api_key}).encode()
@@ -289,7 +290,7 @@ class _WatcherBridge:
             with urllib.request.urlopen(req, timeout=5) as resp:
                 data = json.loads(resp.read().decode())
                 self._token    = data.get("token", "")
-                self._token_ts = time.time()
+                self._token_ts = time.monotonic()
                 return bool(self._token)
         except Exception as exc:
             log.warn(f"[bridge] Auth failed: {exc}")
@@ -423,7 +424,6 @@ class _AppProcess:
         # Keep a local reference so this thread's wait() is not affected
         # by self._proc being replaced during a restart.
         try:
-            import os
             with self._lock:
                 proc = subprocess.Popen(
                     cmd,
@@ -522,7 +522,6 @@ class _AppProcess:
             return
         # Signal the process group so child threads also get the signal
         try:
-            import os
             try:
                 os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
             except Exception:
@@ -539,7 +538,6 @@ class _AppProcess:
 
         log.warn("[watch] Process did not stop on SIGTERM — sending SIGKILL")
         try:
-            import os
             try:
                 os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
             except Exception:
@@ -607,16 +605,17 @@ def watch_and_run(
         log.info("--clean: build cache cleared.")
 
     all_manifests: dict = {}
+    manifests:     list = []
     for p in projects:
         m = hooksmod.ProjectManifest.load(Path(p["dir"]))
+        manifests.append(m)
         if m is not None:
             all_manifests[m.artifact_id] = m
 
     total = len(projects)
-    for i, project in enumerate(projects, 1):
+    for i, (project, manifest) in enumerate(zip(projects, manifests), 1):
         log.step(i, total, project["name"])
 
-        manifest = hooksmod.ProjectManifest.load(Path(project["dir"]))
         artifact  = Path(project["artifact"]) if project.get("artifact") else None
 
         if (
@@ -801,8 +800,7 @@ def watch_and_run(
         except Exception:
             pass
         # Hard deadline: if app.stop() hangs, force-kill after 6 s total.
-        import os as _os
-        t0 = time.time()
+        t0 = time.perf_counter()
         stop_thread = threading.Thread(target=app.stop, daemon=True, name="stop")
         stop_thread.start()
         stop_thread.join(timeout=6)
@@ -819,8 +817,8 @@ def watch_and_run(
             stop_thread.join(timeout=1)
             if stop_thread.is_alive():
                 log.warn("[watch] Hard exit — process would not die cleanly.")
-                _os._exit(0)
-        log.info(f"[watch] Done. ({time.time() - t0:.1f}s)")
+                os._exit(0)
+        log.info(f"[watch] Done. ({time.perf_counter() - t0:.1f}s)")
 
     return True
 